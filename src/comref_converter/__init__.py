@@ -21,35 +21,83 @@ Load the comref_converter package properly.
 __version__ = "0.8.1"
 __author__ = "Pau Torras"
 
+from functools import lru_cache
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type
+
 from .mtn import ast as AST
-from .translator_base import MeasureID
-from .translator_mei import TranslatorMEI
-from .translator_mxml import TranslatorMXML
-from .translator_sequence import TranslatorSequence
-from .translator_xml import TranslatorXML
-from .visitor_count_nodes import VisitorCountNodes
-from .visitor_get_nodes import VisitorGetNodes
-from .visitor_to_abaro import VisitorToABaro
-from .visitor_to_apted import VisitorToAPTED
-from .visitor_to_dot import VisitorToDOT
-from .visitor_to_mei import VisitorToMEI
-from .visitor_to_mxml import VisitorToMXML
-from .visitor_to_sequence import VisitorToModelSequence
-from .visitor_to_xml import VisitorToXML
-
-translators = [
-    TranslatorMEI,
-    TranslatorMXML,
-    TranslatorSequence,
-    TranslatorXML,
-]
-visitors = [
-    VisitorCountNodes,
-    VisitorToAPTED,
-    VisitorToDOT,
-    VisitorToMEI,
-    VisitorToModelSequence,
-    VisitorToMXML,
-    VisitorToXML,
-    VisitorToABaro,
-]
+
+if TYPE_CHECKING:
+    from .translator_base import MeasureID
+    from .translator_mei import TranslatorMEI
+    from .translator_mxml import TranslatorMXML
+    from .translator_sequence import TranslatorSequence
+    from .translator_xml import TranslatorXML
+    from .visitor_count_nodes import VisitorCountNodes
+    from .visitor_get_nodes import VisitorGetNodes
+    from .visitor_to_abaro import VisitorToABaro
+    from .visitor_to_apted import VisitorToAPTED
+    from .visitor_to_dot import VisitorToDOT
+    from .visitor_to_mei import VisitorToMEI
+    from .visitor_to_mxml import VisitorToMXML
+    from .visitor_to_sequence import VisitorToModelSequence
+    from .visitor_to_xml import VisitorToXML
+
+# Translators and visitors are only imported when first accessed
+_NAME_TO_MODULE: Dict[str, str] = {
+    "MeasureID": ".translator_base",
+    "TranslatorMEI": ".translator_mei",
+    "TranslatorMXML": ".translator_mxml",
+    "TranslatorSequence": ".translator_sequence",
+    "TranslatorXML": ".translator_xml",
+    "VisitorCountNodes": ".visitor_count_nodes",
+    "VisitorGetNodes": ".visitor_get_nodes",
+    "VisitorToABaro": ".visitor_to_abaro",
+    "VisitorToAPTED": ".visitor_to_apted",
+    "VisitorToDOT": ".visitor_to_dot",
+    "VisitorToMEI": ".visitor_to_mei",
+    "VisitorToMXML": ".visitor_to_mxml",
+    "VisitorToModelSequence": ".visitor_to_sequence",
+    "VisitorToXML": ".visitor_to_xml",
+}
+
+_TRANSLATORS = (
+    "TranslatorMEI",
+    "TranslatorMXML",
+    "TranslatorSequence",
+    "TranslatorXML",
+)
+_VISITORS = (
+    "VisitorCountNodes",
+    "VisitorToAPTED",
+    "VisitorToDOT",
+    "VisitorToMEI",
+    "VisitorToModelSequence",
+    "VisitorToMXML",
+    "VisitorToXML",
+    "VisitorToABaro",
+)
+
+
+@lru_cache(maxsize=None)
+def _load(name: str) -> Any:
+    return getattr(import_module(_NAME_TO_MODULE[name], __name__), name)
+
+
+@lru_cache(maxsize=None)
+def _load_all(names: Tuple[str, ...]) -> List[Type]:
+    return [_load(name) for name in names]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _NAME_TO_MODULE:
+        return _load(name)
+    if name == "translators":
+        return _load_all(_TRANSLATORS)
+    if name == "visitors":
+        return _load_all(_VISITORS)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_NAME_TO_MODULE, "translators", "visitors"])
@@ -24,27 +24,42 @@ from typing import Optional
 
 from apted.helpers import Tree
 
+KIND_OTHER = 0
+KIND_NOTE = 1
+KIND_REST = 2
+
+_KINDS = {"note": KIND_NOTE, "rest": KIND_REST}
+
 
 class AptedTree(Tree):
     def __init__(self, name, *children):
         super().__init__(name, *children)
         self.note_id: Optional[int] = None
 
-    @classmethod
-    def from_text(cls, text):
-        return super().from_text(text)
+        # Integer tag so that notes and rests are told apart without string compares
+        self.kind: int = _KINDS.get(name, KIND_OTHER)
+
+        # Hash of the whole subtree, built from those of the children so that trees
+        # can be looked up without walking them. Trees are never modified after they
+        # are built, so it does not go stale.
+        self.digest: int = hash((name, *[x.digest for x in self.children]))
 
-    @classmethod
-    def decorate_tree_with_note_ids(cls, tree: AptedTree) -> None:
-        note_id = 0
+    def same_as(self, other: AptedTree) -> bool:
+        """Tell whether two trees have the same labels and shape.
 
-        def __navigate(tree: AptedTree) -> None:
-            nonlocal note_id
-            if tree.name in {"note", "rest"}:
-                tree.note_id = note_id
-                note_id += 1
-                return None
-            for nd in tree.children:
-                __navigate(nd)
+        Parameters
+        ----------
+        other : AptedTree
+            Tree to compare against.
 
-        __navigate(tree)
+        Returns
+        -------
+        bool
+            True if both trees would have the same bracket notation.
+        """
+        return (
+            self.digest == other.digest
+            and self.name == other.name
+            and len(self.children) == len(other.children)
+            and all(x.same_as(y) for x, y in zip(self.children, other.children))
+        )
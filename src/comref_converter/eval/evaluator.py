@@ -19,20 +19,39 @@ Evaluation object implementation.
 """
 
 
-from collections import Counter
-from copy import deepcopy
-from fractions import Fraction
-from typing import Any, Dict, List, Optional, Tuple, Union
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 from warnings import warn
 
 from apted import APTED
 
 from ..mtn import AST
-from ..visitor_count_nodes import VisitorCountNodes
-from ..visitor_get_notes import VisitorGetNotes
-from ..visitor_get_tokens import VisitorGetTokens
-from ..visitor_to_apted import VisitorToAPTED
 from .apted_tree import AptedTree
+from .visitor_measure_summary import MeasureSummary, VisitorMeasureSummary
+
+
+def _empty_counts() -> Dict[str, int]:
+    return {"tp": 0, "fp": 0, "fn": 0}
+
+
+class PairResult(NamedTuple):
+    """Raw counts obtained from evaluating a single pair of measures."""
+
+    confmat: Dict[str, Dict[str, int]]
+    edits: float
+    target_length: int
+    target_notes: int
+    source_notes: int
+    matched_notes: int
+    unmatched_source: int
+    unmatched_target: int
+    perfect_pitch: int
+    perfect_staff: int
+    perfect_time: int
+    offset_pitch: int
+    offset_staff: int
+    offset_time: float
 
 
 class Evaluator:
@@ -46,7 +65,7 @@ class Evaluator:
         self.total_source_notes = 0
 
         # Class to count per class
-        self.confmat: Dict[str, Dict[str, int]] = {}
+        self.confmat: Dict[str, Dict[str, int]] = defaultdict(_empty_counts)
 
         # Counts considering the predictions
         self.matched_notes = 0
@@ -59,33 +78,123 @@ class Evaluator:
 
         self.cumulative_pitch_error = 0
         self.cumulative_staff_error = 0
-        self.cumulative_time_error = Fraction(0)
+        self.cumulative_time_error = 0.0
+
+        # Reused across updates to avoid rebuilding its dispatch table every time
+        self._summary_visitor = VisitorMeasureSummary()
+        self._ted_cache = TedCache()
 
     def update(
         self,
         source: AST.Measure,
         target: AST.Measure,
     ) -> Tuple[Dict[str, Dict[str, int]], float, Dict[str, Any]]:
-        confmat = self._tier1(source, target)
-        matching, ted = self._tier2(source, target)
-        measure_stats = self._tier3(matching)
+        return self._reduce(
+            _evaluate_pair(source, target, self._summary_visitor, self._ted_cache)
+        )
 
-        return confmat, ted, measure_stats
+    @property
+    def ted_cache(self) -> "TedCache":
+        """Get the cache of tree edit results used by update, e.g. for its hit rate.
 
-    def _tier1(
+        Pairs evaluated through update_batch use a cache per worker process instead.
+        """
+        return self._ted_cache
+
+    def update_batch(
         self,
-        source: AST.Measure,
-        target: AST.Measure,
-    ) -> Dict[str, Dict[str, int]]:
-        token_visitor = VisitorGetTokens()
+        pairs: Iterable[Tuple[AST.Measure, AST.Measure]],
+        max_workers: Optional[int] = None,
+        chunksize: int = 32,
+    ) -> List[Tuple[Dict[str, Dict[str, int]], float, Dict[str, Any]]]:
+        """Evaluate many measure pairs in parallel.
 
-        source_tokens = list(map(str, token_visitor.visit_ast(source)))
-        target_tokens = list(map(str, token_visitor.visit_ast(target)))
+        Each pair is evaluated in a worker process and the results are accumulated in
+        order, so the final state is the same as calling update on each pair.
 
-        partial_mat = self._compute_conf_matrix(source_tokens, target_tokens)
-        self.confmat = self._merge_conf_matrices(self.confmat, partial_mat)
+        Parameters
+        ----------
+        pairs : Iterable[Tuple[AST.Measure, AST.Measure]]
+            Source (prediction) and target (ground truth) measures to compare.
+        max_workers : Optional[int]
+            Number of worker processes. Defaults to the number of processors.
+        chunksize : int
+            Number of pairs sent to a worker process at once.
+
+        Returns
+        -------
+        List[Tuple[Dict[str, Dict[str, int]], float, Dict[str, Any]]]
+            The output of update for each pair, in the same order.
+        """
+        sources, targets = [], []
+        for source, target in pairs:
+            sources.append(source)
+            targets.append(target)
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker
+        ) as pool:
+            return [
+                self._reduce(result)
+                for result in pool.map(
+                    _evaluate_pair, sources, targets, chunksize=chunksize
+                )
+            ]
+
+    def _reduce(
+        self, result: "PairResult"
+    ) -> Tuple[Dict[str, Dict[str, int]], float, Dict[str, Any]]:
+        """Accumulate the evaluation of a single pair into the running totals.
 
-        return partial_mat
+        Parameters
+        ----------
+        result : PairResult
+            Output of evaluating a pair of measures.
+
+        Returns
+        -------
+        Tuple[Dict[str, Dict[str, int]], float, Dict[str, Any]]
+            The confusion matrix, tree edit rate and note statistics of the pair.
+        """
+        self._accumulate_conf_matrix(self.confmat, result.confmat)
+
+        self.edits += result.edits
+        self.total_length += result.target_length
+        self.total_target_notes += result.target_notes
+        self.total_source_notes += result.source_notes
+        self.unmatched_source += result.unmatched_source
+        self.unmatched_target += result.unmatched_target
+        self.matched_notes += result.matched_notes
+
+        self.perfect_pitch += result.perfect_pitch
+        self.perfect_staff += result.perfect_staff
+        self.perfect_time += result.perfect_time
+
+        self.cumulative_pitch_error += result.offset_pitch
+        self.cumulative_staff_error += result.offset_staff
+        self.cumulative_time_error += result.offset_time
+
+        matched = result.matched_notes
+        if matched == 0:
+            measure_stats = {
+                "perfect_pitch": 0.0,
+                "perfect_staff": 0.0,
+                "perfect_time": 0.0,
+                "offset_pitch": 0.0,
+                "offset_staff": 0.0,
+                "offset_time": 0.0,
+            }
+        else:
+            measure_stats = {
+                "perfect_pitch": result.perfect_pitch / matched,
+                "perfect_staff": result.perfect_staff / matched,
+                "perfect_time": result.perfect_time / matched,
+                "offset_pitch": result.offset_pitch / matched,
+                "offset_staff": result.offset_staff / matched,
+                "offset_time": result.offset_time / matched,
+            }
+
+        return result.confmat, result.edits / result.target_length, measure_stats
 
     @staticmethod
     def _compute_conf_matrix(
@@ -96,29 +205,44 @@ class Evaluator:
 
         confmat = {}
 
-        for tok in set(source_counts.keys()) | set(target_counts.keys()):
-            source_value = source_counts.get(tok, 0)
-            target_value = target_counts.get(tok, 0)
-            confmat[tok] = {
-                "tp": min(source_value, target_value),
-                "fp": max(0, source_value - target_value),
-                "fn": max(0, target_value - source_value),
-            }
+        for tok, source_value in source_counts.items():
+            target_value = target_counts.pop(tok, 0)
+            if source_value > target_value:
+                confmat[tok] = {
+                    "tp": target_value,
+                    "fp": source_value - target_value,
+                    "fn": 0,
+                }
+            else:
+                confmat[tok] = {
+                    "tp": source_value,
+                    "fp": 0,
+                    "fn": target_value - source_value,
+                }
+
+        # Whatever is left in the target counter has not been predicted at all
+        for tok, target_value in target_counts.items():
+            confmat[tok] = {"tp": 0, "fp": 0, "fn": target_value}
         return confmat
 
     @staticmethod
-    def _merge_conf_matrices(
-        source: Dict[str, Dict[str, int]], new: Dict[str, Dict[str, int]]
-    ) -> Dict[str, Dict[str, int]]:
-        output = deepcopy(source)
-        for tok in set(source.keys()) | set(new.keys()):
-            if tok in source and tok in new:
-                output[tok]["tp"] += new[tok]["tp"]
-                output[tok]["fp"] += new[tok]["fp"]
-                output[tok]["fn"] += new[tok]["fn"]
-            elif tok in new:
-                output[tok] = new[tok]
-        return output
+    def _accumulate_conf_matrix(
+        total: Dict[str, Dict[str, int]], new: Dict[str, Dict[str, int]]
+    ) -> None:
+        """Add the counts of a partial confusion matrix into a running total in place.
+
+        Parameters
+        ----------
+        total : Dict[str, Dict[str, int]]
+            Running confusion matrix. Must create empty counts for unseen tokens.
+        new : Dict[str, Dict[str, int]]
+            Confusion matrix of a single sample. It is left untouched.
+        """
+        for tok, counts in new.items():
+            acc = total[tok]
+            acc["tp"] += counts["tp"]
+            acc["fp"] += counts["fp"]
+            acc["fn"] += counts["fn"]
 
     @staticmethod
     def compute_precision_recall(
@@ -143,114 +267,6 @@ class Evaluator:
             }
         return output
 
-    def _tier2(
-        self,
-        source: AST.Measure,
-        target: AST.Measure,
-    ) -> Tuple[
-        List[Tuple[Union[AST.Note, AST.Rest], Union[AST.Note, AST.Rest]]], float
-    ]:
-        apted_visitor = VisitorToAPTED()
-        note_visitor = VisitorGetNotes()
-        node_visitor = VisitorCountNodes()
-
-        source_tree = AptedTree.from_text(apted_visitor.visit_ast(source))
-        target_tree = AptedTree.from_text(apted_visitor.visit_ast(target))
-
-        AptedTree.decorate_tree_with_note_ids(source_tree)
-        AptedTree.decorate_tree_with_note_ids(target_tree)
-
-        source_notes = note_visitor.visit_ast(source)
-        target_notes = note_visitor.visit_ast(target)
-
-        apted_comp = APTED(target_tree, source_tree)
-
-        # TARGET TO SOURCE
-        mapping = apted_comp.compute_edit_mapping()
-        edits = apted_comp.compute_edit_distance()
-
-        matching_ids, unmatched_tgt, unmatched_src = self._find_matching_notes(mapping)
-
-        matching_notes = [
-            (target_notes[ii], source_notes[jj]) for ii, jj in matching_ids
-        ]
-
-        target_counts = node_visitor.visit_ast(target)
-
-        self.edits += edits
-        self.total_length += target_counts
-        self.total_target_notes += len(target_notes)
-        self.total_source_notes += len(source_notes)
-        self.unmatched_source += len(unmatched_src)
-        self.unmatched_target += len(unmatched_tgt)
-        self.matched_notes += len(matching_notes)
-        return matching_notes, edits / target_counts
-
-    def _tier3(
-        self,
-        matching: List[Tuple[Union[AST.Note, AST.Rest], Union[AST.Note, AST.Rest]]],
-    ) -> Dict[str, Any]:
-        perfect_pitch = 0
-        perfect_staff = 0
-        perfect_time = 0
-        offset_pitch = 0
-        offset_staff = 0
-        offset_time = Fraction(0)
-        for target, source in matching:
-            tgt_pitch, src_pitch = target.get_pitch(), source.get_pitch()
-
-            pitch_difference = (
-                tgt_pitch.position if tgt_pitch.position is not None else 0
-            ) - (src_pitch.position if src_pitch.position is not None else 0)
-
-            if pitch_difference == 0:
-                perfect_pitch += 1
-            offset_pitch += pitch_difference
-
-            staff_difference = (
-                tgt_pitch.staff if tgt_pitch.staff is not None else 0
-            ) - (src_pitch.staff if src_pitch.staff is not None else 0)
-
-            if staff_difference == 0:
-                perfect_staff += 1
-            offset_staff += staff_difference
-
-            tgt_delta, src_delta = target.get_delta(), source.get_delta()
-            if tgt_delta is None or src_delta is None:
-                warn("Invalid time value found in a notehead")
-            else:
-                time_difference = tgt_delta - src_delta
-                if int(time_difference) == 0:
-                    perfect_time += 1
-                offset_time += time_difference
-
-        self.perfect_pitch += perfect_pitch
-        self.perfect_staff += perfect_staff
-        self.perfect_time += perfect_time
-
-        self.cumulative_pitch_error += offset_pitch
-        self.cumulative_staff_error += offset_staff
-        self.cumulative_time_error += offset_time
-
-        if len(matching) == 0:
-            return {
-                "perfect_pitch": 0.0,
-                "perfect_staff": 0.0,
-                "perfect_time": 0.0,
-                "offset_pitch": 0.0,
-                "offset_staff": 0.0,
-                "offset_time": 0.0,
-            }
-
-        return {
-            "perfect_pitch": perfect_pitch / len(matching),
-            "perfect_staff": perfect_staff / len(matching),
-            "perfect_time": perfect_time / len(matching),
-            "offset_pitch": offset_pitch / len(matching),
-            "offset_staff": offset_staff / len(matching),
-            "offset_time": float(offset_time) / len(matching),
-        }
-
     @staticmethod
     def _increment_count_dict(
         dictionary: Dict[str, int], toks: List[str]
@@ -301,11 +317,11 @@ class Evaluator:
         delta_shift = (
             (self.cumulative_time_error / self.matched_notes)
             if self.matched_notes > 0
-            else Fraction(0)
+            else 0.0
         )
 
         return (
-            self.confmat,
+            dict(self.confmat),
             self.compute_precision_recall(self.confmat),
             {
                 "ter": ter,
@@ -316,7 +332,7 @@ class Evaluator:
                 "dp": delta_precision,
                 "pitch_shift": pitch_shift,
                 "staff_shift": staff_shift,
-                "delta_shift": float(delta_shift),
+                "delta_shift": delta_shift,
             },
         )
 
@@ -332,36 +348,251 @@ class Evaluator:
             A list of matching ids, a list of unmatched ids in the target (false
             negatives) and a list of unmatched ids in the source (false positives).
         """
-        notes_and_rests = [
-            match
-            for match in matching
-            if (match[0] is not None and match[0].name in {"rest", "note"})
-            or (match[1] is not None and match[1].name in {"rest", "note"})
-        ]
-
-        matched = [
-            (match[0].note_id, match[1].note_id)
-            for match in notes_and_rests
-            if match[0] is not None
-            and match[0].note_id is not None
-            and match[1] is not None
-            and match[1].note_id is not None
-        ]
-
-        unmatched_target = [
-            match[0].note_id
-            for match in notes_and_rests
-            if match[0] is not None
-            and match[0].note_id is not None
-            and match[1] is None
-        ]
-
-        unmatched_source = [
-            match[1].note_id
-            for match in notes_and_rests
-            if match[1] is not None
-            and match[1].note_id is not None
-            and match[0] is None
-        ]
+        matched = []
+        unmatched_target = []
+        unmatched_source = []
+
+        for tgt, src in matching:
+            tgt_ok = tgt is not None and tgt.kind and tgt.note_id is not None
+            src_ok = src is not None and src.kind and src.note_id is not None
+
+            if tgt_ok and src_ok:
+                matched.append((tgt.note_id, src.note_id))
+            elif tgt_ok and src is None:
+                unmatched_target.append(tgt.note_id)
+            elif src_ok and tgt is None:
+                unmatched_source.append(src.note_id)
 
         return matched, unmatched_target, unmatched_source
+
+
+# Edit distance, matched note ids and number of unmatched target and source notes
+_TedResult = Tuple[float, List[Tuple[int, int]], int, int]
+
+# Target tree, source tree and the result of comparing them
+_TedEntry = Tuple[AptedTree, AptedTree, _TedResult]
+
+
+class TedCache:
+    """Least recently used memo of tree edit results between pairs of trees.
+
+    Identical measures are common in music and the edit distance computation dominates
+    the evaluation time. Entries are looked up by the digests of both trees, which are
+    computed while the trees are built, and confirmed by comparing the trees on a hit.
+    Note identifiers follow the order of notes in the tree, so they are fully
+    determined by its labels and shape as well.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """Construct an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of tree pairs to remember.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[int, int], _TedEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups that were found in the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def get(self, target: AptedTree, source: AptedTree) -> Optional[_TedResult]:
+        """Get the result for a pair of trees, or None if it is not cached."""
+        key = (target.digest, source.digest)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0].same_as(target) and entry[1].same_as(source):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        return None
+
+    def put(self, target: AptedTree, source: AptedTree, result: _TedResult) -> None:
+        """Remember the result for a pair of trees."""
+        self._entries[(target.digest, source.digest)] = (target, source, result)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+_worker_visitor: Optional[VisitorMeasureSummary] = None
+_worker_ted_cache: Optional[TedCache] = None
+
+
+def _init_worker() -> None:
+    """Create the summary visitor and cache shared by evaluations in a worker."""
+    global _worker_visitor, _worker_ted_cache
+    _worker_visitor = VisitorMeasureSummary()
+    _worker_ted_cache = TedCache()
+
+
+def _evaluate_pair(
+    source: AST.Measure,
+    target: AST.Measure,
+    summary_visitor: Optional[VisitorMeasureSummary] = None,
+    ted_cache: Optional[TedCache] = None,
+) -> PairResult:
+    """Evaluate a pair of measures without modifying any evaluator state.
+
+    Defined at module level so that it can be sent to worker processes.
+
+    Parameters
+    ----------
+    source : AST.Measure
+        Predicted measure.
+    target : AST.Measure
+        Ground truth measure.
+    summary_visitor : Optional[VisitorMeasureSummary]
+        Visitor used to summarise both measures. Defaults to the one of the current
+        worker process, or a new one if there is none.
+    ted_cache : Optional[TedCache]
+        Cache of tree edit results. Defaults to the one of the current worker process,
+        or no caching if there is none.
+
+    Returns
+    -------
+    PairResult
+        Every count needed to update the state of an Evaluator.
+    """
+    if summary_visitor is None:
+        summary_visitor = _worker_visitor or VisitorMeasureSummary()
+    if ted_cache is None:
+        ted_cache = _worker_ted_cache
+    source_summary = summary_visitor.visit_ast(source)
+    target_summary = summary_visitor.visit_ast(target)
+
+    confmat = Evaluator._compute_conf_matrix(
+        source_summary.tokens, target_summary.tokens
+    )
+    matching, edits, unmatched_tgt, unmatched_src = _tier2(
+        source_summary, target_summary, ted_cache
+    )
+
+    return PairResult(
+        confmat,
+        edits,
+        target_summary.node_count,
+        len(target_summary.notes),
+        len(source_summary.notes),
+        len(matching),
+        unmatched_src,
+        unmatched_tgt,
+        *_tier3(matching),
+    )
+
+
+def _tier2(
+    source: MeasureSummary,
+    target: MeasureSummary,
+    ted_cache: Optional[TedCache] = None,
+) -> Tuple[
+    List[Tuple[Union[AST.Note, AST.Rest], Union[AST.Note, AST.Rest]]],
+    float,
+    int,
+    int,
+]:
+    source_notes = source.notes
+    target_notes = target.notes
+
+    edits, matching_ids, unmatched_tgt, unmatched_src = _tree_edit(
+        target.apted, source.apted, ted_cache
+    )
+
+    matching_notes = [(target_notes[ii], source_notes[jj]) for ii, jj in matching_ids]
+
+    return matching_notes, edits, unmatched_tgt, unmatched_src
+
+
+def _tree_edit(
+    target: AptedTree,
+    source: AptedTree,
+    ted_cache: Optional[TedCache] = None,
+) -> _TedResult:
+    """Compute the tree edit distance between two trees and match their notes.
+
+    Parameters
+    ----------
+    target : AptedTree
+        Tree of the ground truth measure.
+    source : AptedTree
+        Tree of the predicted measure.
+    ted_cache : Optional[TedCache]
+        Cache to look the result up in and store it into, if any.
+
+    Returns
+    -------
+    _TedResult
+        The edit distance, the pairs of matched target and source note ids and the
+        number of unmatched target and source notes.
+    """
+    if ted_cache is not None:
+        cached = ted_cache.get(target, source)
+        if cached is not None:
+            return cached
+
+    apted_comp = APTED(target, source)
+
+    # TARGET TO SOURCE
+    mapping = apted_comp.compute_edit_mapping()
+    edits = apted_comp.compute_edit_distance()
+
+    matching_ids, unmatched_tgt, unmatched_src = Evaluator._find_matching_notes(mapping)
+    result = (edits, matching_ids, len(unmatched_tgt), len(unmatched_src))
+
+    if ted_cache is not None:
+        ted_cache.put(target, source, result)
+    return result
+
+
+def _tier3(
+    matching: List[Tuple[Union[AST.Note, AST.Rest], Union[AST.Note, AST.Rest]]],
+) -> Tuple[int, int, int, int, int, float]:
+    perfect_pitch = 0
+    perfect_staff = 0
+    perfect_time = 0
+    offset_pitch = 0
+    offset_staff = 0
+    offset_time = 0.0
+    for target, source in matching:
+        tgt_staff, tgt_position = target.get_pitch()
+        src_staff, src_position = source.get_pitch()
+
+        # None means "anywhere", which is measured as zero
+        pitch_difference = (tgt_position or 0) - (src_position or 0)
+
+        if pitch_difference == 0:
+            perfect_pitch += 1
+        offset_pitch += pitch_difference
+
+        staff_difference = (tgt_staff or 0) - (src_staff or 0)
+
+        if staff_difference == 0:
+            perfect_staff += 1
+        offset_staff += staff_difference
+
+        tgt_delta, src_delta = target.get_delta(), source.get_delta()
+        if tgt_delta is None or src_delta is None:
+            warn("Invalid time value found in a notehead")
+        else:
+            time_difference = tgt_delta - src_delta
+            if int(time_difference) == 0:
+                perfect_time += 1
+            # Offsets are only reported as floats, no need to keep them exact
+            offset_time += float(time_difference)
+
+    return (
+        perfect_pitch,
+        perfect_staff,
+        perfect_time,
+        offset_pitch,
+        offset_staff,
+        offset_time,
+    )
@@ -40,7 +40,20 @@ class OptionalMeasureID(NamedTuple):
 class SampleGroup:
     def __init__(self, scores: List[AST.Score]) -> None:
         self.scores = scores
+        self._score_set = set(scores)
         self.index = self._create_index(self.scores)
+        self._create_secondary_indices()
+
+    def _create_secondary_indices(self) -> None:
+        # Secondary indices to answer partially specified queries. Dicts are used as
+        # ordered sets so that results keep the order of the main index.
+        self.by_work: Dict[str, Dict[MeasureID, None]] = {}
+        self.by_part: Dict[str, Dict[MeasureID, None]] = {}
+        self.by_measure: Dict[str, Dict[MeasureID, None]] = {}
+        for key in self.index:
+            self.by_work.setdefault(key.work, {})[key] = None
+            self.by_part.setdefault(key.part, {})[key] = None
+            self.by_measure.setdefault(key.measure, {})[key] = None
 
     @staticmethod
     def _create_index(scores: List[AST.Score]) -> Dict[MeasureID, AST.Measure]:
@@ -72,17 +85,22 @@ class SampleGroup:
         return list(self.index.keys())
 
     def _get_with_none(self, query: OptionalMeasureID) -> List[AST.Measure]:
-        chosen_keys = [x for x in self.index.keys() if self._compare(query, x)]
+        candidates = [
+            secondary.get(value, {})
+            for secondary, value in (
+                (self.by_work, query.work),
+                (self.by_part, query.part),
+                (self.by_measure, query.measure),
+            )
+            if value is not None
+        ]
+        if len(candidates) == 0:
+            return list(self.index.values())
+
+        smallest = min(candidates, key=len)
+        chosen_keys = [k for k in smallest if all(k in c for c in candidates)]
         return [self.index[k] for k in chosen_keys]
 
-    @staticmethod
-    def _compare(query: OptionalMeasureID, key: MeasureID) -> bool:
-        work_equal = query.work is None or query.work == key.work
-        part_equal = query.part is None or query.part == key.part
-        measure_equal = query.measure is None or query.measure == key.measure
-
-        return work_equal and part_equal and measure_equal
-
     def merge(self, other: SampleGroup) -> SampleGroup:
         """Merge two sets of samples into one.
 
@@ -96,6 +114,13 @@ class SampleGroup:
         SampleGroup
             A sample group with all unique samples in both.
         """
-        scores = list(set(self.scores + other.scores))
-
-        return SampleGroup(scores)
+        merged = SampleGroup.__new__(SampleGroup)
+        merged.scores = self.scores + [
+            x for x in other.scores if x not in self._score_set
+        ]
+        merged._score_set = self._score_set | other._score_set
+        # Both indices are already built, there is no need to go through the measures
+        merged.index = {**self.index, **other.index}
+        merged._create_secondary_indices()
+
+        return merged
@@ -0,0 +1,140 @@
+"""Test evaluation metrics on known measure pairs."""
+
+import unittest
+from collections import defaultdict
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from ...translator_xml import TranslatorXML
+from ..apted_tree import AptedTree
+from ..evaluator import Evaluator, TedCache
+
+
+class TestEvaluator(unittest.TestCase):
+    """Test the Evaluator object on reference MTN files."""
+
+    REFERENCE = Path(__file__).parents[3] / "test" / "clef_changes_reference.mtn"
+
+    def setUp(self) -> None:
+        translator = TranslatorXML()
+        root = ET.parse(self.REFERENCE).getroot()
+        self.score = translator.translate(root, self.REFERENCE.stem, set())
+
+    def test_conf_matrix_counts(self) -> None:
+        """Test true positive, false positive and false negative counting."""
+        confmat = Evaluator._compute_conf_matrix(
+            ["a", "a", "b", "c"], ["a", "b", "b", "d"]
+        )
+        self.assertEqual(
+            confmat,
+            {
+                "a": {"tp": 1, "fp": 1, "fn": 0},
+                "b": {"tp": 1, "fp": 0, "fn": 1},
+                "c": {"tp": 0, "fp": 1, "fn": 0},
+                "d": {"tp": 0, "fp": 0, "fn": 1},
+            },
+        )
+
+    def test_conf_matrix_accumulation(self) -> None:
+        """Test that the global confusion matrix adds up per-measure results."""
+        evaluator = Evaluator()
+        partials = [
+            evaluator.update(measure, measure)[0] for measure in self.score.measures
+        ]
+
+        for tok, counts in evaluator.confmat.items():
+            with self.subTest(tok=tok):
+                self.assertEqual(
+                    counts["tp"], sum(x.get(tok, {"tp": 0})["tp"] for x in partials)
+                )
+                self.assertEqual(counts["fp"], 0)
+                self.assertEqual(counts["fn"], 0)
+
+    def test_identical_measures(self) -> None:
+        """Test that comparing a score with itself yields perfect metrics."""
+        evaluator = Evaluator()
+        for measure in self.score.measures:
+            _, ted, _ = evaluator.update(measure, measure)
+            self.assertEqual(ted, 0.0)
+
+        _, precrec, summary = evaluator.summarise()
+
+        self.assertEqual(summary["ter"], 0.0)
+        self.assertEqual(summary["mnr"], 0.0)
+        self.assertEqual(summary["fpr"], 0.0)
+        self.assertEqual(summary["pp"], 1.0)
+        self.assertEqual(summary["dp"], 1.0)
+        for tok, values in precrec.items():
+            with self.subTest(tok=tok):
+                self.assertEqual(values["precision"], 1.0)
+                self.assertEqual(values["recall"], 1.0)
+
+    def test_summary_conf_matrix(self) -> None:
+        """Test that unseen tokens are not silently added to the summary."""
+        evaluator = Evaluator()
+        for measure in self.score.measures:
+            evaluator.update(measure, measure)
+
+        confmat, _, _ = evaluator.summarise()
+
+        self.assertNotIsInstance(confmat, defaultdict)
+        self.assertEqual(confmat, evaluator.confmat)
+        with self.assertRaises(KeyError):
+            confmat["<unseen>"]
+
+    def test_update_batch(self) -> None:
+        """Test that parallel evaluation matches sequential evaluation."""
+        measures = self.score.measures
+        pairs = list(zip(measures, measures[1:] + measures[:1]))
+
+        sequential = Evaluator()
+        expected = [sequential.update(source, target) for source, target in pairs]
+
+        parallel = Evaluator()
+        results = parallel.update_batch(pairs, max_workers=2, chunksize=4)
+
+        self.assertEqual(results, expected)
+        self.assertEqual(parallel.summarise(), sequential.summarise())
+
+    def test_find_matching_notes(self) -> None:
+        """Test partitioning of an APTED mapping into matched and unmatched notes."""
+        note, rest, other = AptedTree("note"), AptedTree("rest"), AptedTree("group")
+        note.note_id, rest.note_id = 0, 1
+        mapping = [
+            (note, rest),
+            (rest, None),
+            (None, note),
+            (note, other),
+            (other, None),
+            (None, None),
+        ]
+
+        self.assertEqual(Evaluator._find_matching_notes(mapping), ([(0, 1)], [1], [0]))
+
+    def test_ted_cache(self) -> None:
+        """Test that memoised tree edits give the same results as fresh ones."""
+        measures = self.score.measures
+        pairs = list(zip(measures, measures[1:] + measures[:1]))
+
+        evaluator = Evaluator()
+        first = [evaluator.update(source, target) for source, target in pairs]
+        cached = len(evaluator.ted_cache)
+        second = [evaluator.update(source, target) for source, target in pairs]
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(evaluator.ted_cache), cached)
+        self.assertGreaterEqual(evaluator.ted_cache.hits, len(pairs))
+        self.assertEqual(len(Evaluator().ted_cache), 0)
+
+    def test_ted_cache_collision(self) -> None:
+        """Test that trees with the same digest but different labels are told apart."""
+        cache = TedCache()
+        first, second = AptedTree("a", AptedTree("b")), AptedTree("a", AptedTree("c"))
+        second.digest = first.digest
+
+        cache.put(first, first, (0.0, [], 0, 0))
+
+        self.assertEqual(cache.get(first, first), (0.0, [], 0, 0))
+        self.assertIsNone(cache.get(second, first))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_rate, 0.5)
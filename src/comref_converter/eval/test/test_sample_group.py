@@ -0,0 +1,59 @@
+"""Test sample group indexing."""
+
+import unittest
+import xml.etree.ElementTree as ET
+from itertools import product
+from pathlib import Path
+
+from ...translator_xml import TranslatorXML
+from ..sample_group import OptionalMeasureID, SampleGroup
+
+
+class TestSampleGroup(unittest.TestCase):
+    """Test measure lookups on a group of reference scores."""
+
+    REFERENCES = sorted((Path(__file__).parents[3] / "test").glob("*_reference.mtn"))
+
+    def setUp(self) -> None:
+        translator = TranslatorXML()
+        self.scores = []
+        for reference in self.REFERENCES:
+            root = ET.parse(reference).getroot()
+            self.scores.append(translator.translate(root, reference.stem, set()))
+            translator.reset()
+
+    def test_partial_queries(self) -> None:
+        """Test that partially specified queries match a full scan of the index."""
+        group = SampleGroup(self.scores)
+        works = [None, "complex_reference", "missing"]
+        parts = [None, "P1", "P2"]
+        measures = [None, "1", "3"]
+
+        for work, part, measure in product(works, parts, measures):
+            if None not in (work, part, measure):
+                continue
+            query = OptionalMeasureID(work, part, measure)
+            with self.subTest(query=query):
+                expected = [
+                    v
+                    for k, v in group.index.items()
+                    if (work is None or k.work == work)
+                    and (part is None or k.part == part)
+                    and (measure is None or k.measure == measure)
+                ]
+                self.assertEqual(
+                    [id(x) for x in group[query]], [id(x) for x in expected]
+                )
+
+    def test_merge(self) -> None:
+        """Test that merging groups keeps every unique score and measure."""
+        first = SampleGroup(self.scores[:3])
+        second = SampleGroup(self.scores[2:])
+        merged = first.merge(second)
+
+        self.assertEqual([id(x) for x in merged.scores], [id(x) for x in self.scores])
+        self.assertEqual(merged.index, SampleGroup(self.scores).index)
+        self.assertEqual(
+            len(merged[OptionalMeasureID(None, "P1", None)]),
+            len(SampleGroup(self.scores)[OptionalMeasureID(None, "P1", None)]),
+        )
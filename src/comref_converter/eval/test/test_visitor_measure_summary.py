@@ -0,0 +1,135 @@
+"""Test the evaluation summary visitor against the standalone visitors."""
+
+import unittest
+import xml.etree.ElementTree as ET
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Iterator, List, Optional
+from unittest import mock
+from zipfile import ZipFile
+
+from ...mtn import ast as AST
+from ...translator_mxml import TranslatorMXML
+from ...translator_xml import TranslatorXML
+from ...visitor_count_nodes import VisitorCountNodes
+from ...visitor_get_notes import VisitorGetNotes
+from ...visitor_get_tokens import VisitorGetTokens
+from ...visitor_to_apted import VisitorToAPTED
+from ..apted_tree import KIND_OTHER, AptedTree
+from ..visitor_measure_summary import VisitorMeasureSummary
+
+
+class TestVisitorMeasureSummary(unittest.TestCase):
+    """Test that the summary visitor matches the output of each separate visitor."""
+
+    SCENARIOS = Path(__file__).parents[3] / "test"
+    REFERENCES = sorted(SCENARIOS.glob("*_reference.mtn"))
+    MUSICXML = sorted(SCENARIOS.glob("*.mxl"))
+
+    # None of the scenarios has tuplets, so they are covered by a hand-written measure
+    TUPLETS = """
+    <score id="tuplets">
+        <measure part_id="P1" measure_id="1" staves="1">
+            <note_group delta="0">
+                <chord delta="0">
+                    <stem type="up" id="1" />
+                    <note>
+                        <notehead type="black" staff="1" position="2" id="2" />
+                        <tuplet>
+                            <number type="3" id="3" />
+                            <tuplet type="start" id="4" />
+                        </tuplet>
+                    </note>
+                </chord>
+            </note_group>
+            <rest delta="1/3">
+                <rest type="quarter" staff="1" id="5" />
+                <tuplet>
+                    <tuplet type="stop" id="6" />
+                </tuplet>
+            </rest>
+        </measure>
+    </score>
+    """
+
+    # Visiting methods that are never reached from within a measure
+    NOT_IN_MEASURES = {"visit_ast", "visit_score", "visit_toplevel"}
+
+    @classmethod
+    def _note_ids(cls, tree: AptedTree) -> List[Optional[int]]:
+        if tree.kind != KIND_OTHER:
+            return [tree.note_id]
+        return [y for x in tree.children for y in cls._note_ids(x)]
+
+    @classmethod
+    def _scores(cls) -> Iterator[AST.Score]:
+        for reference in cls.REFERENCES:
+            root = ET.parse(reference).getroot()
+            yield TranslatorXML().translate(root, reference.stem, set())
+
+        for source in cls.MUSICXML:
+            with ZipFile(source) as f_zip:
+                with f_zip.open(f_zip.namelist()[-1], "r") as xml_file:
+                    root = ET.parse(xml_file).getroot()
+            yield TranslatorMXML().translate(root, source.stem, set())
+
+        yield TranslatorXML().translate(ET.fromstring(cls.TUPLETS), "tuplets", set())
+
+    def test_matches_standalone_visitors(self) -> None:
+        """Test tokens, APTED tree, notes and node counts on every scenario."""
+        summary_visitor = VisitorMeasureSummary()
+
+        for score in self._scores():
+            for measure in score.measures:
+                with self.subTest(
+                    score=score.score_id,
+                    part=measure.part_id,
+                    measure=measure.measure_id,
+                ):
+                    summary = summary_visitor.visit_ast(measure)
+
+                    # Token order is irrelevant for the confusion matrix
+                    self.assertEqual(
+                        sorted(summary.tokens),
+                        sorted(map(str, VisitorGetTokens().visit_ast(measure))),
+                    )
+                    self.assertEqual(
+                        summary.apted.bracket(), VisitorToAPTED().visit_ast(measure)
+                    )
+                    self.assertEqual(
+                        self._note_ids(summary.apted), list(range(len(summary.notes)))
+                    )
+                    self.assertEqual(
+                        [id(x) for x in summary.notes],
+                        [id(x) for x in VisitorGetNotes().visit_ast(measure)],
+                    )
+                    self.assertEqual(
+                        summary.node_count, VisitorCountNodes().visit_ast(measure)
+                    )
+
+    def test_covers_every_node_type(self) -> None:
+        """Test that the scenarios above reach every kind of node within a measure."""
+        names = [
+            name
+            for name in dir(VisitorMeasureSummary)
+            if name.startswith("visit_") and name not in self.NOT_IN_MEASURES
+        ]
+
+        with ExitStack() as stack:
+            mocks = {
+                name: stack.enter_context(
+                    mock.patch.object(
+                        VisitorMeasureSummary,
+                        name,
+                        autospec=True,
+                        side_effect=getattr(VisitorMeasureSummary, name),
+                    )
+                )
+                for name in names
+            }
+            summary_visitor = VisitorMeasureSummary()
+            for score in self._scores():
+                for measure in score.measures:
+                    summary_visitor.visit_ast(measure)
+
+        self.assertEqual([x for x in names if not mocks[x].called], [])
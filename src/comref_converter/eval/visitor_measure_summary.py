@@ -0,0 +1,132 @@
+# The CWMN Optical Music Recognition Framework (COMREF) toolset.
+#
+# Copyright (C) 2023, Pau Torras <ptorras@cvc.uab.cat>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Gather everything the evaluator needs from a tree while building its APTED tree.
+"""
+
+from typing import Any, Callable, List, NamedTuple, Union
+
+from ..mtn import ast as AST
+from ..visitor_to_apted import VisitorToAPTED
+from .apted_tree import AptedTree
+
+
+class MeasureSummary(NamedTuple):
+    """Data extracted from a tree for evaluation purposes."""
+
+    tokens: List[str]
+    apted: AptedTree
+    notes: List[Union[AST.Note, AST.Rest]]
+    node_count: int
+
+
+class VisitorMeasureSummary(VisitorToAPTED):
+    """Build the APTED tree of a subtree and collect its tokens and notes on the way.
+
+    The tree is the one VisitorToAPTED describes, built as AptedTree nodes instead of
+    bracketed text so that it does not need parsing back. Note and rest nodes are
+    numbered after their position in the list of notes. Nodes are counted as they are
+    dispatched, following the same rules as VisitorCountNodes.
+    """
+
+    _NO_NODE = None
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tokens: List[str] = []
+        self.notes: List[Union[AST.Note, AST.Rest]] = []
+        self.node_count = 0
+
+        self._dispatch = {
+            node_type: self._counted(method)
+            for node_type, method in self._dispatch.items()
+        }
+
+    def _counted(self, method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """Wrap a visiting method so that it counts the node before visiting it."""
+
+        def visit(node: AST.SyntaxNode) -> Any:
+            self.node_count += 1
+            return method(node)
+
+        return visit
+
+    def reset(self) -> None:
+        """Drop everything gathered on the previous visit."""
+        self.tokens = []
+        self.notes = []
+        self.node_count = 0
+
+    def visit_ast(self, root: AST.SyntaxNode) -> MeasureSummary:  # type: ignore
+        """Summarise a tree for evaluation.
+
+        Parameters
+        ----------
+        root: AST.SyntaxNode
+            Any subtree to summarise. Usually a Measure.
+
+        Returns
+        -------
+        MeasureSummary
+            Token strings, APTED tree, notes and rests in MTN order and node count.
+        """
+        self.reset()
+
+        apted = root.accept(self)
+
+        return MeasureSummary(self.tokens, apted, self.notes, self.node_count)
+
+    def visit_score(self, score: AST.Score) -> AptedTree:  # type: ignore
+        """Perform visiting operation on Score node."""
+        return self._node("score", [x.accept(self) for x in score.measures])
+
+    def visit_note(self, note: AST.Note) -> AptedTree:  # type: ignore
+        """Perform visiting operation on Note node."""
+        note_id = len(self.notes)
+        self.notes.append(note)
+
+        output = super().visit_note(note)
+        output.note_id = note_id
+        return output
+
+    def visit_rest(self, rest: AST.Rest) -> AptedTree:  # type: ignore
+        """Perform visiting operation on Rest node."""
+        note_id = len(self.notes)
+        self.notes.append(rest)
+
+        output = super().visit_rest(rest)
+        output.note_id = note_id
+        return output
+
+    def visit_tuplet(self, tuplet: AST.Tuplet) -> AptedTree:  # type: ignore
+        """Perform visiting operation on Tuplet node.
+
+        Tuplets are counted as a single node by the note or rest containing them.
+        """
+        node_count = self.node_count
+        output = super().visit_tuplet(tuplet)
+        self.node_count = node_count
+        return output
+
+    def visit_token(self, token: AST.Token) -> AptedTree:  # type: ignore
+        """Perform visiting operation on Token node."""
+        self.tokens.append(str(token))
+        return super().visit_token(token)
+
+    def _node(self, label: str, children: List[Any]) -> AptedTree:
+        """Build an APTED node, leaving out children with no APTED representation."""
+        return AptedTree(label, *[x for x in children if x is not None])
@@ -19,7 +19,7 @@ Helper class to manage a stack of NoteGroups.
 """
 
 
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from . import mtn as MTN
 from .music_state import ScoreState
@@ -31,9 +31,12 @@ class GroupStack:
         self.score_state = score_state
         self.symbol_table = symbol_table
 
-        self.stack: Dict[bool, List[MTN.AST.NoteGroup]] = {
-            grace: [] for grace in [False, True]
-        }
+        self._normal: List[MTN.AST.NoteGroup] = []
+        self._grace: List[MTN.AST.NoteGroup] = []
+
+    def _s(self, grace: bool) -> List[MTN.AST.NoteGroup]:
+        """Return the stack for grace or regular notes."""
+        return self._grace if grace else self._normal
 
     def new_level(self, grace: bool) -> MTN.AST.NoteGroup:
         """Create a new beaming level."""
@@ -54,37 +57,42 @@ class GroupStack:
 
     def push(self, grace: bool, group: MTN.AST.NoteGroup) -> None:
         """Add new element to the stack."""
-        if len(self.stack[grace]) > 0:
-            self.stack[grace][-1].children.append(group)
-        self.stack[grace].append(group)
+        stack = self._s(grace)
+        if len(stack) > 0:
+            stack[-1].children.append(group)
+        stack.append(group)
 
     def pop(self, grace: bool) -> Optional[MTN.AST.NoteGroup]:
         """Remove element from the stack."""
-        if len(self.stack[grace]) == 0:
+        stack = self._s(grace)
+        if len(stack) == 0:
             raise ValueError("No NoteGroup is present in the stack")
 
-        return self.stack[grace].pop()
+        return stack.pop()
 
     def top(self, grace: bool) -> Optional[MTN.AST.NoteGroup]:
         """Return the element at the top of the stack if it exists."""
-        if len(self.stack[grace]) == 0:
+        stack = self._s(grace)
+        if len(stack) == 0:
             return None
-        return self.stack[grace][-1]
+        return stack[-1]
 
     def bottom(self, grace: bool) -> Optional[MTN.AST.NoteGroup]:
         """Return the element at the bottom of the stack if it exists."""
-        if len(self.stack[grace]) == 0:
+        stack = self._s(grace)
+        if len(stack) == 0:
             return None
-        return self.stack[grace][0]
+        return stack[0]
 
     def length(self, grace: bool) -> int:
         """Get number of elements in the stack."""
-        return len(self.stack[grace])
+        return len(self._s(grace))
 
     def reset(self) -> None:
         """Set back to default empty state."""
-        self.stack = {grace: [] for grace in [False, True]}
+        self._normal.clear()
+        self._grace.clear()
 
     def reset_grace(self, grace: bool) -> None:
         """Set back to default empty state only for the given grace note."""
-        self.stack[grace] = []
+        self._s(grace).clear()
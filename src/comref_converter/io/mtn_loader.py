@@ -19,21 +19,44 @@ Load MTN file.
 """
 
 
-import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    # Optional: libxml2-backed parsing is noticeably faster on large files. Unlike the
+    # standard library, lxml keeps comments and processing instructions in the tree by
+    # default, so they are dropped at parse time to yield the same elements.
+    from lxml import etree as ET
+
+    _PARSER: Any = ET.XMLParser(remove_comments=True, remove_pis=True)
+except ImportError:
+    import xml.etree.ElementTree as ET  # type: ignore
+
+    _PARSER = None
 
 from ..mtn import AST
 from ..translator_xml import TranslatorXML
 
 
+@lru_cache(maxsize=128)
+def _parse(path: str, mtime_ns: int) -> Any:
+    """Parse an MTN file and cache the root of the document.
+
+    The modification time is part of the cache key so that files that change on disk
+    are parsed again. Translators never modify the element tree, so it can be shared
+    between loads.
+    """
+    return ET.parse(path, _PARSER).getroot()
+
+
 class MTNLoader:
     def __init__(self) -> None:
         self.translator = TranslatorXML()
 
     def load(self, path: Path, first_line: Optional[Path] = None) -> AST.Score:
-        root = ET.parse(path)
-        score = self.translator(root.getroot())
+        root = _parse(str(path), path.stat().st_mtime_ns)
+        score = self.translator.translate(root, path.stem, set())
         self.translator.reset()
 
         return score
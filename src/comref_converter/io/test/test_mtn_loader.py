@@ -0,0 +1,50 @@
+"""Test loading of MTN files."""
+
+import unittest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from ...translator_xml import TranslatorXML
+from .. import mtn_loader
+from ..mtn_loader import MTNLoader
+
+
+class TestMTNLoader(unittest.TestCase):
+    """Test the MTN file loader."""
+
+    REFERENCE = Path(__file__).parents[3] / "test" / "complex_reference.mtn"
+    SCENARIOS = sorted(REFERENCE.parent.glob("*_reference.mtn"))
+
+    def test_repeated_load(self) -> None:
+        """Test that loading the same file twice parses it once."""
+        loader = MTNLoader()
+        mtn_loader._parse.cache_clear()
+
+        first = loader.load(self.REFERENCE)
+        second = loader.load(self.REFERENCE)
+
+        self.assertEqual(mtn_loader._parse.cache_info().hits, 1)
+        self.assertIsNot(first, second)
+        self.assertTrue(first.compare(second))
+
+    def test_matches_standard_library(self) -> None:
+        """Test that the loader gives the same score whatever parser is installed."""
+        loader = MTNLoader()
+        for path in self.SCENARIOS:
+            with self.subTest(reference=path.name):
+                expected = TranslatorXML().translate(
+                    ET.parse(path).getroot(), path.stem, set()
+                )
+                self.assertTrue(loader.load(path).compare(expected))
+
+    def test_comments_are_ignored(self) -> None:
+        """Test that comments kept in the tree do not change the translation."""
+        for path in self.SCENARIOS:
+            with self.subTest(reference=path.name):
+                parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
+                root = ET.parse(path).getroot()
+                commented = ET.parse(path, parser=parser).getroot()
+
+                expected = TranslatorXML().translate(root, path.stem, set())
+                actual = TranslatorXML().translate(commented, path.stem, set())
+                self.assertTrue(actual.compare(expected))
@@ -20,150 +20,214 @@ Class hierarchy for MTN elements.
 
 from __future__ import annotations
 
-import re
-from abc import ABC, abstractmethod
+from bisect import insort
 from fractions import Fraction
-from functools import total_ordering
-from typing import (Any, Dict, Generator, List, NamedTuple, Optional, Sequence,
-                    Type, Union, cast)
+from math import lcm
+from operator import attrgetter
+from typing import (Any, Callable, Dict, Generator, List, NamedTuple, Optional,
+                    Sequence, Tuple, Type, Union, cast)
 
 from . import semantics as MS
 from . import types as TT
 
+_PITCHES_PER_OCTAVE = MS.PITCHES_PER_OCTAVE
 
-class Visitor(ABC):
+# Deltas repeat constantly within and across scores. Sharing a single Fraction per
+# value lets tuple comparisons (see SyntaxNode._VALUE_ATTRS) succeed on identity.
+_DELTAS: Dict[Tuple[int, int], Fraction] = {}
+
+
+def _intern_delta(delta: Fraction) -> Fraction:
+    return _DELTAS.setdefault((delta.numerator, delta.denominator), delta)
+
+
+class Visitor:
     """Base class for ast visitors for transformation and navigation of mtn notation."""
 
-    @abstractmethod
+    def __init__(self) -> None:
+        # Bound visiting methods per node type, so dispatching a node is a lookup
+        self._dispatch: Dict[Type[SyntaxNode], Callable[[Any], Any]] = {
+            node_type: getattr(self, method)
+            for node_type, method in _VISIT_METHODS.items()
+        }
+
+    def visit(self, node: SyntaxNode) -> Any:
+        """Perform the visiting operation that corresponds to the type of the node."""
+        return self._dispatch.get(type(node), self.generic_visit)(node)
+
+    def generic_visit(self, node: SyntaxNode) -> Any:
+        """Visit the children of a node whose type has no visiting method."""
+        for child in node.children_nodes():
+            child.accept(self)
+        return None
+
     def visit_ast(self, root: SyntaxNode) -> Any:
         """Perform visiting operation."""
         return None
 
-    @abstractmethod
     def visit_score(self, score: Score) -> Any:
         """Perform visiting operation on Score node."""
         return None
 
-    @abstractmethod
     def visit_note(self, note: Note) -> Any:
         """Perform visiting operation on Note node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_toplevel(self, toplevel: TopLevel) -> Any:
         """Perform visiting operation on TopLevel node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_token(self, token: Token) -> Any:
         """Perform visiting operation on Token node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_chord(self, chord: Chord) -> Any:
         """Perform visiting operation on Chord node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_rest(self, rest: Rest) -> Any:
         """Perform visiting operation on Rest node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_note_group(self, note_group: NoteGroup) -> Any:
         """Perform visiting operation on NoteGroup node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_attributes(self, attributes: Attributes) -> Any:
         """Perform visiting operation on Attributes node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_time_signature(self, time_signature: TimeSignature) -> Any:
         """Perform visiting operation on TimeSignature node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_key(self, key: Key) -> Any:
         """Perform visiting operation on Key node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_clef(self, clef: Clef) -> Any:
         """Perform visiting operation on Clef node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_direction(self, direction: Direction) -> Any:
         """Perform visiting operation on Direction node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_measure(self, measure: Measure) -> Any:
         """Perform visiting operation on Measure node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_barline(self, barline: Barline) -> Any:
         """Perform visiting operation on Barline node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_tuplet(self, tuplet: Tuplet) -> Any:
         """Perform visiting operation on Tuplet node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_numerator(self, numerator: Numerator) -> Any:
         """Perform visiting operation on Numerator node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_denominator(self, denominator: Denominator) -> Any:
         """Perform visiting operation on Denominator node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_number(self, number: Number) -> Any:
         """Perform visiting operation on Number node."""
         raise NotImplementedError
 
-    @abstractmethod
     def visit_timesig_fraction(self, fraction: TimesigFraction) -> Any:
         """Perform visiting operation on timesig fraction node."""
         raise NotImplementedError
 
 
-class SyntaxNode(ABC):
+class SyntaxNode:
     """Interface for visitable types within the MTN AST."""
 
-    # TODO: Maybe this makes things a bit easier. In order to do it however I need to
-    # change attributes to lists (which makes sense, since staff identifiers are
-    # always contiguous, the only annoying thing is the off-by-one error from MusicXML
-    # identifiers starting from 1).
-    #
-    # def __init__(self) -> None:
-    #     super().__init__()
-    #     self.__child_nodes = []
+    __slots__ = ()
+
+    # Names of the attributes holding child nodes, in MTN order. Each one may hold a
+    # node, None or a list of nodes (which may contain None).
+    _CHILD_ATTRS: Tuple[str, ...] = ()
+
+    # Order in which children are compared. Defaults to _CHILD_ATTRS, but subclasses
+    # may list cheap children first so that mismatches are found before long lists.
+    _COMPARE_ATTRS: Tuple[str, ...] = ()
+
+    # Names of the attributes holding plain values that must match for two nodes to
+    # be equal. They are fetched together by _get_values, set on each subclass.
+    _VALUE_ATTRS: Tuple[str, ...] = ()
+    _get_values: Optional[Callable[[SyntaxNode], Any]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._get_values = attrgetter(*cls._VALUE_ATTRS) if cls._VALUE_ATTRS else None
+        if "_CHILD_ATTRS" in vars(cls) and "_COMPARE_ATTRS" not in vars(cls):
+            cls._COMPARE_ATTRS = cls._CHILD_ATTRS
 
-    @abstractmethod
     def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        raise NotImplementedError
+        """Have visitor perform operation on node.
+
+        Every node type dispatches through the table the visitor builds from
+        _VISIT_METHODS, so subclasses do not override this method. Types missing from
+        the table fall back to the generic visit of the visitor.
+        """
+        try:
+            method = visitor._dispatch[type(self)]
+        except KeyError:
+            method = visitor.generic_visit
+        return method(self)
 
-    @abstractmethod
     def compare(self, other: SyntaxNode) -> bool:
-        """Compare two elements for equality of contents. Calls recursively."""
-        raise NotImplementedError
+        """Compare two elements for equality of contents. Calls recursively.
+
+        Two nodes of the same type are equal if the attributes in _VALUE_ATTRS and
+        the children in _CHILD_ATTRS are.
+        """
+        if not isinstance(other, type(self)):
+            return False
+        get_values = self._get_values
+        if get_values is not None and get_values(self) != get_values(other):
+            return False
+        return self._compare_children(other)
 
-    @abstractmethod
     def compare_raise(self, other: SyntaxNode) -> None:
         """Compare two elements for equality of contents. Raises on false."""
         if not isinstance(other, type(self)):
             raise TypeError(
                 f"Type of produced object ({type(other)}) is different than expected ({type(self)})"
             )
+        self._compare_values(other, True)
+        self._compare_children(other, True)
+
+    def _compare_values(self, other: SyntaxNode, raises: bool = False) -> bool:
+        """Compare every value attribute listed in _VALUE_ATTRS against other's."""
+        get_values = self._get_values
+        if get_values is None or get_values(self) == get_values(other):
+            return True
+        if raises:
+            for attr in self._VALUE_ATTRS:
+                expected = getattr(self, attr)
+                produced = getattr(other, attr)
+                if expected != produced:
+                    raise ValueError(
+                        f"{type(self).__name__} has the wrong {attr.lstrip('_')}. "
+                        f"Expected {expected} but got {produced}"
+                    )
+        return False
+
+    def _compare_children(self, other: SyntaxNode, raises: bool = False) -> bool:
+        """Compare every child attribute listed in _COMPARE_ATTRS against other's."""
+        for attr in self._COMPARE_ATTRS:
+            base = getattr(self, attr)
+            target = getattr(other, attr)
+            if isinstance(base, list) and isinstance(target, list):
+                if not self._compare_lists(base, target, raises):
+                    return False
+            elif not self._compare_maybe(base, target, raises):
+                return False
+        return True
 
     @staticmethod
     def _compare_lists(
@@ -171,25 +235,23 @@ class SyntaxNode(ABC):
         other: Sequence[SyntaxNode],
         raises: bool = False,
     ) -> bool:
-        if not len(base) == len(other):
+        length = len(base)
+        if not length == len(other):
             if raises:
                 raise ValueError(
-                    f"Length of produced sequence ({len(other)}) is different than expected ({len(base)})"
+                    f"Length of produced sequence ({len(other)}) is different than expected ({length})"
                 )
+            return False
+        # Most child lists (dots, accidentals, modifiers...) hold zero to a few items,
+        # where indexing is cheaper than setting up a zip iterator.
         if raises:
-            return all(
-                map(
-                    lambda x: x[0].compare_raise(x[1]),
-                    zip(base, other),
-                )
-            )
-        else:
-            return all(
-                map(
-                    lambda x: x[0].compare(x[1]),
-                    zip(base, other),
-                )
-            )
+            for ii in range(length):
+                base[ii].compare_raise(other[ii])
+            return True
+        for ii in range(length):
+            if not base[ii].compare(other[ii]):
+                return False
+        return True
 
     @staticmethod
     def _compare_maybe(
@@ -212,37 +274,65 @@ class SyntaxNode(ABC):
             return False
         return True
 
-    # def iter_children(self) -> Generator[SyntaxNode]:
-    #     yield self
+    def children_nodes(self) -> List[SyntaxNode]:
+        """Return the direct children of the node in MTN order."""
+        output: List[SyntaxNode] = []
+        for attr in self._CHILD_ATTRS:
+            value = getattr(self, attr)
+            if value is None:
+                continue
+            if isinstance(value, SyntaxNode):
+                output.append(value)
+            else:
+                output.extend(x for x in value if isinstance(x, SyntaxNode))
+        return output
 
-    #     for child in self.__child_nodes:
-    #         if isinstance(SyntaxNode, child):
-    #             yield from child.iter_children()
-    #         elif isinstance(list, child):
-    #             for ch2 in child:
-    #                 yield ch2
+    def iter_descendants(self) -> Generator[SyntaxNode, None, None]:
+        """Yield every node below this one in depth-first pre-order.
 
-    # def register_children(self, *args) -> None:
-    #     for arg in args:
-    #         self.__child_nodes.append(arg)
+        Uses an explicit stack, so deeply nested trees do not hit the recursion limit.
+        """
+        stack = self.children_nodes()
+        stack.reverse()
+
+        while stack:
+            node = stack.pop()
+            yield node
+
+            children = node.children_nodes()
+            children.reverse()
+            stack.extend(children)
 
 
 class TopLevel(SyntaxNode):
     """Represent any element that lies within a music measure."""
 
+    __slots__ = ("delta",)
+    _VALUE_ATTRS = ("delta",)
+
+    # Set on each concrete subclass from _OBJECT_PRECEDENCE
+    _PRECEDENCE: int
+
     def __init__(self, delta: Fraction) -> None:
         super().__init__()
-        self.delta = delta
+        self.delta = _intern_delta(delta)
 
     def __lt__(self, other: TopLevel) -> bool:
         """Compare two toplevel elements and see which one takes precedence."""
-        if self.delta < other.delta:
+        if self is other:
+            return False
+
+        # Deltas are compared as cross-multiplied integers, which is exact and avoids
+        # going through Fraction's rich comparison twice.
+        self_ticks = self.delta.numerator * other.delta.denominator
+        other_ticks = other.delta.numerator * self.delta.denominator
+        if self_ticks < other_ticks:
             return True
-        elif self.delta > other.delta:
+        elif self_ticks > other_ticks:
             return False
 
-        self_precedence = _OBJECT_PRECEDENCE[type(self)]
-        other_precedence = _OBJECT_PRECEDENCE[type(other)]
+        self_precedence = self._PRECEDENCE
+        other_precedence = other._PRECEDENCE
 
         if self_precedence < other_precedence:
             return True
@@ -255,14 +345,17 @@ class TopLevel(SyntaxNode):
 
     def __eq__(self, other: object) -> bool:
         """Compare two toplevel elements and see which one takes precedence."""
+        if self is other:
+            return True
+
         if not isinstance(other, TopLevel):
             return False
 
         if self.delta != other.delta:
             return False
 
-        self_precedence = _OBJECT_PRECEDENCE[type(self)]
-        other_precedence = _OBJECT_PRECEDENCE[type(other)]
+        self_precedence = self._PRECEDENCE
+        other_precedence = other._PRECEDENCE
 
         if self_precedence != other_precedence:
             return False
@@ -274,20 +367,13 @@ class TopLevel(SyntaxNode):
     def position(self) -> MS.StaffPosition:
         return MS.StaffPosition(None, None)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_toplevel(self)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
+    def sort_key(self) -> Tuple[Fraction, int, int]:
+        """Produce a key that orders toplevel elements as comparing them does.
 
-        if not isinstance(other, TopLevel):
-            raise TypeError("Other object is not TopLevel - no delta value")
-
-        if self.delta != other.delta:
-            raise ValueError(
-                f"Expected delta value of {str(self.delta)} but got {str(other.delta)} instead."
-            )
+        Sorting with it computes precedence and position once per element instead of
+        once per comparison.
+        """
+        return self.delta, self._PRECEDENCE, int(self.position())
 
 
 class BoundingBox(NamedTuple):
@@ -312,6 +398,17 @@ class BoundingBox(NamedTuple):
 class Token(SyntaxNode):
     """Represents a single object instance within the ast."""
 
+    __slots__ = (
+        "token_type",
+        "modifiers",
+        "_position",
+        "_position_int",
+        "token_id",
+        "coordinates",
+        "_str_cache",
+    )
+    _VALUE_ATTRS = ("token_type", "_position", "modifiers")
+
     def __init__(
         self,
         token_type: TT.TokenType,
@@ -329,8 +426,17 @@ class Token(SyntaxNode):
 
         self.coordinates = token_coords
 
+        self._str_cache: Optional[str] = None
+
     def __str__(self) -> str:
-        """Quick representation of the token for debugging."""
+        """Quick representation of the token for debugging.
+
+        It is computed once and cached, so modifiers must only be changed through
+        set_modifier after the token has been converted into a string.
+        """
+        if self._str_cache is not None:
+            return self._str_cache
+
         output = self.token_type.value
         key_names = sorted(self.modifiers.keys())
         mods = self.modifiers
@@ -341,49 +447,54 @@ class Token(SyntaxNode):
             ]
         )
 
-        return output + ("_" * (len(modifiers) > 0)) + modifiers
+        self._str_cache = output + ("_" * (len(modifiers) > 0)) + modifiers
+        return self._str_cache
 
     def __repr__(self) -> str:
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_token(self)
+    @property
+    def position(self) -> MS.StaffPosition:
+        """Position of the token within the staff."""
+        return self._position
+
+    @position.setter
+    def position(self, position: MS.StaffPosition) -> None:
+        # The integer form is what sorting uses, so it is computed once per change
+        self._position = position
+        self._position_int = int(position)
 
     def compare(self, other: SyntaxNode) -> bool:
+        # Tokens are the bulk of any tree, so they skip the generic machinery
         if not isinstance(other, Token):
             return False
         return (
             self.token_type == other.token_type
-            and self.position == other.position
+            and self._position == other._position
             and self.modifiers == other.modifiers
         )
 
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Token, other)
-
-        if self.token_type != other.token_type:
-            raise ValueError(f"Expected token type {type(self)} but got {type(other)}")
-
-        if self.position != other.position:
-            raise ValueError(
-                f"Expected token position {str(self.position)} but got {str(other.position)}"
-            )
+    def set_modifier(self, name: str, value: Any) -> None:
+        """Set the value of a modifier, keeping the cached representation valid.
 
-        if self.modifiers != other.modifiers:
-            raise ValueError(
-                f"Expected token modifiers to be: \n"
-                f"{' '.join(self.modifiers.values())}"
-                f" but got Expected token modifiers to be: \n"
-                f"{' '.join(other.modifiers.values())}"
-            )
+        Parameters
+        ----------
+        name : str
+            Name of the modifier.
+        value : Any
+            Value of the modifier.
+        """
+        self.modifiers[name] = value
+        self._str_cache = None
 
 
 class Note(SyntaxNode):
     """Represents all tokens related to a single note."""
 
+    __slots__ = ("notehead", "dots", "accidentals", "modifiers", "parent")
+    _CHILD_ATTRS = ("notehead", "dots", "accidentals", "modifiers")
+
     def __init__(
         self,
         notehead: Token,
@@ -412,31 +523,6 @@ class Note(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_note(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Note):
-            return False
-        if not self.notehead.compare(other.notehead):
-            return False
-
-        return (
-            self._compare_lists(self.dots, other.dots)
-            and self._compare_lists(self.accidentals, other.accidentals)
-            and self._compare_lists(self.modifiers, other.modifiers)
-        )
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Note, other)
-
-        self.notehead.compare_raise(other.notehead)
-        self._compare_lists(self.dots, other.dots, True)
-        self._compare_lists(self.accidentals, other.accidentals, True)
-        self._compare_lists(self.modifiers, other.modifiers, True)
-
     def position(self) -> MS.StaffPosition:
         """Get position of the note for in-chord sorting."""
         return self.notehead.position
@@ -455,6 +541,10 @@ class Note(SyntaxNode):
 class Chord(SyntaxNode):
     """Represents a set of notes playing together at the same time."""
 
+    __slots__ = ("delta", "stem", "notes")
+    _CHILD_ATTRS = ("stem", "notes")
+    _VALUE_ATTRS = ("delta",)
+
     def __init__(
         self,
         delta: Fraction,
@@ -464,7 +554,7 @@ class Chord(SyntaxNode):
         super().__init__()
 
         assert len(notes) > 0, "Chord without notes."
-        self.delta = delta
+        self.delta = _intern_delta(delta)
         self.stem = stem
         self.notes = notes
 
@@ -480,47 +570,29 @@ class Chord(SyntaxNode):
         return str(self)
 
     def __lt__(self, other: Chord) -> bool:
-        return self.delta < other.delta
+        return (
+            self.delta.numerator * other.delta.denominator
+            < other.delta.numerator * self.delta.denominator
+        )
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Chord):
             return False
         return self.delta == other.delta
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_chord(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Chord):
-            return False
-
-        if not self._compare_maybe(self.stem, other.stem):
-            return False
-
-        if not self.delta == other.delta:
-            return False
-
-        return self._compare_lists(self.notes, other.notes)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Chord, other)
-
-        self._compare_maybe(self.stem, other.stem, True)
-        self._compare_lists(self.notes, other.notes, True)
-
     def add_note(self, note: Note) -> None:
         """Add a note sorted MTN-wise to the chord.
 
+        Notes already in the chord are assumed to be sorted, which holds for chords
+        built from a single note and extended through this method.
+
         Parameters
         ----------
         note : Note
             The note to add to the chord.
         """
         note.parent = self
-        self.notes.append(note)
-        self.notes.sort(key=lambda x: int(x.notehead.position))
+        insort(self.notes, note, key=_notehead_position)
 
     def get_first_note(self) -> Note:
         """Return the first note in the chord."""
@@ -543,7 +615,8 @@ class Chord(SyntaxNode):
 class Rest(TopLevel):
     """Represents a rest within the score."""
 
-    RE_NOTETYPE = re.compile(r"rest_(.*)")
+    __slots__ = ("rest_token", "dots", "modifiers", "rest_type")
+    _CHILD_ATTRS = ("rest_token", "dots", "modifiers")
 
     def __init__(
         self,
@@ -582,32 +655,6 @@ class Rest(TopLevel):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_rest(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Rest):
-            return False
-
-        if not self.delta == other.delta:
-            return False
-
-        if not self.rest_token.compare(other.rest_token):
-            return False
-
-        return self._compare_lists(self.dots, other.dots) and self._compare_lists(
-            self.modifiers, other.modifiers
-        )
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Rest, other)
-
-        self.rest_token.compare_raise(other.rest_token)
-        self._compare_lists(self.dots, other.dots, True)
-        self._compare_lists(self.modifiers, other.modifiers, True)
-
     def get_pitch(self) -> MS.StaffPosition:
         """Get position of the current rest."""
         return self.rest_token.position
@@ -623,6 +670,9 @@ class Rest(TopLevel):
 class NoteGroup(TopLevel):
     """Represents a joint set of notes within the score."""
 
+    __slots__ = ("children", "appendages", "_first_chord")
+    _CHILD_ATTRS = ("appendages", "children")
+
     def __init__(
         self,
         delta: Fraction,
@@ -634,6 +684,9 @@ class NoteGroup(TopLevel):
         self.children = chords_or_groups
         self.appendages = beams_or_flags
 
+        # Computed on demand, since groups are usually built before their children
+        self._first_chord: Optional[Chord] = None
+
     def __str__(self) -> str:
         """Quick representation of a NoteGroup for debugging."""
         return f"Note Group (Delta {self.delta}):" + "\n\t".join(
@@ -652,7 +705,7 @@ class NoteGroup(TopLevel):
 
         if (
             self.delta == other.delta
-            and _OBJECT_PRECEDENCE[type(self)] == _OBJECT_PRECEDENCE[type(other)]
+            and self._PRECEDENCE == other._PRECEDENCE
             and self.position == other.position()
         ):
             if other.get_first_chord().is_stem_upwards():
@@ -663,50 +716,28 @@ class NoteGroup(TopLevel):
 
     def __eq__(self, other: object) -> bool:
         """Compare two toplevel elements and see which one takes precedence."""
-        if not isinstance(other, TopLevel):
-            return False
-        prev = super().__eq__(other)
-
-        if not isinstance(other, NoteGroup) or not prev:
-            return prev
-
-        if not (
-            self.get_first_chord().is_stem_upwards()
-            and other.get_first_chord().is_stem_upwards()
-        ):
-            return False
+        if not isinstance(other, NoteGroup):
+            return super().__eq__(other)
 
-        return True
+        # Fetch each first chord once for both the position and the stem direction
+        self_chord = self.get_first_chord()
+        other_chord = other.get_first_chord()
+        return (
+            self.delta == other.delta
+            and self._PRECEDENCE == other._PRECEDENCE
+            and self_chord.position() == other_chord.position()
+            and self_chord.is_stem_upwards()
+            and other_chord.is_stem_upwards()
+        )
 
     def position(self) -> MS.StaffPosition:
         return self.get_first_chord().position()
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_note_group(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, NoteGroup):
-            return False
-
-        if not self.delta == other.delta:
-            return False
-
-        return self._compare_lists(
-            self.children, other.children
-        ) and self._compare_lists(self.appendages, other.appendages)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(NoteGroup, other)
-
-        self._compare_lists(self.children, other.children, True)
-        self._compare_lists(self.appendages, other.appendages, True)
-
     def merge(self, other: NoteGroup) -> NoteGroup:
         """Merge two NoteGroups together."""
         self.children += other.children
         self.appendages += other.appendages
+        self._first_chord = None
 
         return self
 
@@ -714,29 +745,50 @@ class NoteGroup(TopLevel):
         """Absorb a child node."""
         self.children = other.children
         self.appendages += other.appendages
+        self._first_chord = None
 
         return self
 
     def simplify(self) -> None:
         """Reduce nesting of the NoteGroup."""
-        for child in self.children:
-            if isinstance(child, NoteGroup):
-                child.simplify()
-
-        if len(self.children) == 1 and isinstance(self.children[0], NoteGroup):
-            self.absorb(self.children[0])
+        # Pre-order listing of nested groups. Walking it backwards simplifies every
+        # group after all of its descendants, as a recursive post-order walk would.
+        groups = [self]
+        stack = [self]
+        while stack:
+            group = stack.pop()
+            for child in group.children:
+                if isinstance(child, NoteGroup):
+                    groups.append(child)
+                    stack.append(child)
+
+        for group in reversed(groups):
+            if len(group.children) == 1 and isinstance(group.children[0], NoteGroup):
+                group.absorb(group.children[0])
 
     def get_first_chord(self) -> Chord:
-        """Return the first chord in a NoteGroup (regardless of how deeply nested)."""
-        if isinstance(self.children[0], Chord):
-            return self.children[0]
-        else:
-            return self.children[0].get_first_chord()
+        """Return the first chord in a NoteGroup (regardless of how deeply nested).
+
+        The result is cached. Adding children after the first one keeps it valid, and
+        merging or absorbing groups resets it.
+        """
+        if self._first_chord is not None:
+            return self._first_chord
+
+        child = self.children[0]
+        while not isinstance(child, Chord):
+            child = child.children[0]
+
+        self._first_chord = child
+        return child
 
 
 class Tuplet(SyntaxNode):
     """Represents a set of objects subject to a tuple."""
 
+    __slots__ = ("number", "tuplet")
+    _CHILD_ATTRS = ("tuplet", "number")
+
     def __init__(
         self,
         number: Optional[Number],
@@ -753,36 +805,21 @@ class Tuplet(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        return visitor.visit_tuplet(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Tuplet):
-            return False
-
-        if not self._compare_maybe(self.number, other.number):
-            return False
-
-        return self.tuplet.compare(other.tuplet)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Tuplet, other)
-
-        self._compare_maybe(self.number, other.number)
-        self.tuplet.compare(other.tuplet)
-
 
 class Attributes(TopLevel):
     """Represents a joint set of attributes within the score."""
 
+    __slots__ = ("nstaves", "key", "clef", "timesig")
+    _CHILD_ATTRS = ("key", "clef", "timesig")
+    _VALUE_ATTRS = ("delta", "nstaves")
+
     def __init__(
         self,
         delta: Fraction,
         nstaves: int,
-        key: Dict[int, Key | None],
-        clef: Dict[int, Clef | None],
-        timesig: Dict[int, TimeSignature | None],
+        key: List[Key | None],
+        clef: List[Clef | None],
+        timesig: List[TimeSignature | None],
     ) -> None:
         """Construct attributes change object.
 
@@ -792,15 +829,15 @@ class Attributes(TopLevel):
             Amount of time since the start of the bar.
         nstaves: int
             Number of staves this object encapsulates.
-        key : Dict[int, Key | None]
-            Set of objects representing a key change. A dict that maps a staff with its
-            key signature change, if applicable (otherwise None).
-        clef : Dict[int, Clef | None]
-            Dictionary mapping the staff id with the objects related to the underlying
-            clef change. Maps to none for those staves where there is no change.
-        timesig : Dict[int, TimeSignature | None]
-            Set of objects representing a time signature change. A dict that maps a
-            staff with its time signature, if applicable (otherwise None).
+        key : List[Key | None]
+            Set of objects representing a key change. Position staff - 1 holds the key
+            signature change of that staff, if applicable (otherwise None).
+        clef : List[Clef | None]
+            Objects related to the underlying clef change, where position staff - 1
+            belongs to that staff. None for those staves where there is no change.
+        timesig : List[TimeSignature | None]
+            Set of objects representing a time signature change. Position staff - 1
+            holds the time signature of that staff, if applicable (otherwise None).
         """
         super().__init__(delta)
         self.nstaves = nstaves
@@ -825,14 +862,14 @@ class Attributes(TopLevel):
         return str(self)
 
     def copy(self) -> Attributes:
-        # Written like this to ensure that the dictionaries are not soft copies of the
+        # Written like this to ensure that the lists are not soft copies of the
         # previous ones
         return Attributes(
             self.delta,
             self.nstaves,
-            {k: v for k, v in self.key.items()},
-            {k: v for k, v in self.clef.items()},
-            {k: v for k, v in self.timesig.items()},
+            self.key[:],
+            self.clef[:],
+            self.timesig[:],
         )
 
     def merge(self, other: Attributes) -> None:
@@ -852,80 +889,54 @@ class Attributes(TopLevel):
 
         self.delta = other.delta
 
-        self.key = self._merge_dict(self.key, other.key)
-        self.clef = self._merge_dict(self.clef, other.clef)
-        self.timesig = self._merge_dict(self.timesig, other.timesig)
+        self.key = self._merge_lists(self.key, other.key)
+        self.clef = self._merge_lists(self.clef, other.clef)
+        self.timesig = self._merge_lists(self.timesig, other.timesig)
 
     @staticmethod
-    def _merge_dict(
-        origin: Dict[int, Optional[Any]],
-        target: Dict[int, Optional[Any]],
-    ) -> Dict[int, Optional[Any]]:
-        return {
-            key: target.get(key, None) or origin.get(key, None)
-            for key in sorted(origin.keys() | target.keys())
-        }
-
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_attributes(self)
+    def _merge_lists(
+        origin: List[Optional[Any]],
+        target: List[Optional[Any]],
+    ) -> List[Optional[Any]]:
+        return [t if t is not None else o for o, t in zip(origin, target)]
+
+    def _compare_children(self, other: SyntaxNode, raises: bool = False) -> bool:
+        # Staves without changes are skipped, and keys without any alteration are
+        # considered equal to each other.
+        other = cast(Attributes, other)
 
-    def compare(self, other: SyntaxNode) -> bool:
-        # FIXME: This is getting spaghettier and spaghettier. Improve types.
-        if not isinstance(other, Attributes):
-            return False
+        self_keys, self_clefs, self_timesigs = self._present_objects()
+        other_keys, other_clefs, other_timesigs = other._present_objects()
 
-        if not (self.delta == other.delta and self.nstaves == other.nstaves):
-            return False
+        unaltered_keys = self._without_alterations(self_keys)
+        if not (unaltered_keys and self._without_alterations(other_keys)):
+            if not self._compare_lists(self_keys, other_keys, raises):
+                return False
 
-        self_keys = [x for x in self.key.values() if x is not None]
-        other_keys = [x for x in other.key.values() if x is not None]
-
-        return (
-            (
-                self._compare_lists(self_keys, other_keys)
-                or (
-                    len([y for x in self_keys for y in x.accidentals + x.naturals]) == 0
-                    and len([y for x in other_keys for y in x.accidentals + x.naturals])
-                    == 0
-                )
-            )
-            and self._compare_lists(
-                [x for x in self.clef.values() if x is not None],
-                [x for x in other.clef.values() if x is not None],
-            )
-            and self._compare_lists(
-                [x for x in self.timesig.values() if x is not None],
-                [x for x in other.timesig.values() if x is not None],
-            )
-        )
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Attributes, other)
+        return self._compare_lists(
+            self_clefs, other_clefs, raises
+        ) and self._compare_lists(self_timesigs, other_timesigs, raises)
 
-        self_keys = [x for x in self.key.values() if x is not None]
-        other_keys = [x for x in other.key.values() if x is not None]
+    def _present_objects(
+        self,
+    ) -> Tuple[List[Key], List[Clef], List[TimeSignature]]:
+        """Gather the keys, clefs and time signatures that are set in one pass."""
+        keys: List[Key] = []
+        clefs: List[Clef] = []
+        timesigs: List[TimeSignature] = []
+        for key, clef, timesig in zip(self.key, self.clef, self.timesig):
+            if key is not None:
+                keys.append(key)
+            if clef is not None:
+                clefs.append(clef)
+            if timesig is not None:
+                timesigs.append(timesig)
+        return keys, clefs, timesigs
 
-        try:
-            self._compare_lists(self_keys, other_keys, True)
-        except ValueError:
-            if not (
-                len([y for x in self_keys for y in x.accidentals + x.naturals]) == 0
-                and len([y for x in other_keys for y in x.accidentals + x.naturals])
-                == 0
-            ):
-                raise
-        self._compare_lists(
-            [x for x in self.clef.values() if x is not None],
-            [x for x in other.clef.values() if x is not None],
-            True,
-        )
-        self._compare_lists(
-            [x for x in self.timesig.values() if x is not None],
-            [x for x in other.timesig.values() if x is not None],
-            True,
-        )
+    @staticmethod
+    def _without_alterations(keys: List[Key]) -> bool:
+        """Check whether none of the keys has any accidental or natural."""
+        return not any(x.accidentals or x.naturals for x in keys)
 
     @classmethod
     def make_empty(
@@ -948,66 +959,68 @@ class Attributes(TopLevel):
         AST.Attributes
             Empty attributes object at current time.
         """
-        key: Dict[int, Optional[Key]] = {
-            staff: Key.default_key() if init_default else None
-            for staff in range(1, nstaves + 1)
-        }
-        timesig: Dict[int, Optional[TimeSignature]] = {
-            staff: TimeSignature.default_timesig() if init_default else None
-            for staff in range(1, nstaves + 1)
-        }
-        clef: Dict[int, Optional[Clef]] = {
-            staff: Clef.default_clef(staff) if init_default else None
-            for staff in range(1, nstaves + 1)
-        }
+        if not init_default:
+            return Attributes(
+                delta, nstaves, [None] * nstaves, [None] * nstaves, [None] * nstaves
+            )
+
+        key: List[Optional[Key]] = []
+        timesig: List[Optional[TimeSignature]] = []
+        clef: List[Optional[Clef]] = []
+        for staff in range(1, nstaves + 1):
+            key.append(Key.default_key())
+            timesig.append(TimeSignature.default_timesig())
+            clef.append(Clef.default_clef(staff))
 
         return Attributes(delta, nstaves, key, clef, timesig)
 
     def change_staves(self, nstaves: int, init_default: bool) -> None:
         if nstaves > self.nstaves:
             for ii in range(self.nstaves + 1, nstaves + 1):
-                self.clef[ii] = Clef.default_clef(ii) if init_default else None
-                self.key[ii] = Key.default_key() if init_default else None
-                self.timesig[ii] = (
+                self.clef.append(Clef.default_clef(ii) if init_default else None)
+                self.key.append(Key.default_key() if init_default else None)
+                self.timesig.append(
                     TimeSignature.default_timesig() if init_default else None
                 )
         else:
-            self.clef = {ii: clef for ii, clef in self.clef.items() if ii <= nstaves}
-            self.key = {ii: key for ii, key in self.key.items() if ii <= nstaves}
-            self.timesig = {
-                ii: timesig for ii, timesig in self.timesig.items() if ii <= nstaves
-            }
+            del self.clef[nstaves:]
+            del self.key[nstaves:]
+            del self.timesig[nstaves:]
         self.nstaves = nstaves
 
     def set_clef(self, clef: Clef, staff: int) -> None:
         assert (staff - 1) < self.nstaves, "Attempting write clef on non-existing staff"
-        self.clef[staff] = clef
+        self.clef[staff - 1] = clef
 
     def set_timesig(self, timesig: TimeSignature, staff: int) -> None:
         assert (staff - 1) < self.nstaves, "Attempting write time on non-existing staff"
 
-        self.timesig[staff] = timesig
+        self.timesig[staff - 1] = timesig
 
     def set_key(self, key: Key, staff: int) -> None:
         assert (staff - 1) < self.nstaves, "Attempting write key on non-existing staff"
-        self.key[staff] = key
+        self.key[staff - 1] = key
 
     def get_clef(self, staff: int) -> Optional[Clef]:
         assert (staff - 1) < self.nstaves, "Attempting fetch key on non-existing staff"
-        return self.clef[staff]
+        return self.clef[staff - 1]
 
     def get_timesig(self, staff: int) -> Optional[TimeSignature]:
         assert (staff - 1) < self.nstaves, "Attempting fetch time on non-existing staff"
-        return self.timesig[staff]
+        return self.timesig[staff - 1]
 
     def get_key(self, staff: int) -> Optional[Key]:
         assert (staff - 1) < self.nstaves, "Attempting fetch time on non-existing staff"
-        return self.key[staff]
+        return self.key[staff - 1]
 
 
 class TimeSignature(SyntaxNode):
     """Represents a time signature within the score."""
 
+    __slots__ = ("time_symbol", "compound_time_signature", "time_value")
+    _CHILD_ATTRS = ("time_symbol", "compound_time_signature")
+    _VALUE_ATTRS = ("time_value",)
+
     def __init__(
         self,
         time_symbol: Optional[Token],
@@ -1031,56 +1044,18 @@ class TimeSignature(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_time_signature(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, TimeSignature):
-            return False
-
-        if not self.time_value == other.time_value:
-            return False
-
-        self._compare_maybe(self.time_symbol, other.time_symbol)
-
-        if (
-            self.compound_time_signature is not None
-            and other.compound_time_signature is not None
-        ):
-            return self._compare_lists(
-                self.compound_time_signature, other.compound_time_signature
-            )
-        elif not (self.time_symbol is None and other.time_symbol is None):
-            return False
-        return True
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(TimeSignature, other)
-
-        if not self.time_value == other.time_value:
-            raise ValueError(
-                f"Time value of time signature ({other.time_value}) is different "
-                f"than base ({self.time_value})"
-            )
-        if (
-            self.compound_time_signature is not None
-            and other.compound_time_signature is not None
-        ):
-            self._compare_lists(
-                self.compound_time_signature, other.compound_time_signature, True
-            )
-        self._compare_maybe(self.time_symbol, other.time_symbol, True)
-
     @classmethod
     def default_timesig(cls) -> TimeSignature:
-        return TimeSignature(None, None, Fraction(4, 1))
+        """Return the shared default time signature. It must not be modified."""
+        return _DEFAULT_TIMESIG
 
 
 class TimesigFraction(SyntaxNode):
     """Represents a compound time signature numerator."""
 
+    __slots__ = ("numerator", "denominator")
+    _CHILD_ATTRS = ("numerator", "denominator")
+
     def __init__(
         self,
         numerator: Numerator,
@@ -1098,26 +1073,6 @@ class TimesigFraction(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_timesig_fraction(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, TimesigFraction):
-            return False
-
-        if not self.numerator.compare(other.numerator):
-            return False
-
-        return self._compare_maybe(self.denominator, other.denominator)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(TimesigFraction, other)
-
-        self.numerator.compare_raise(other.numerator)
-        self._compare_maybe(self.denominator, other.denominator, True)
-
     def value(self) -> Fraction:
         if self.denominator is None:
             return Fraction(self.numerator.value(), 1)
@@ -1127,10 +1082,20 @@ class TimesigFraction(SyntaxNode):
 class Numerator(SyntaxNode):
     """Represents a compound time signature numerator."""
 
+    __slots__ = ("digits_or_sum", "_value")
+    _CHILD_ATTRS = ("digits_or_sum",)
+
     def __init__(self, digits_or_sum: List[Union[Number, Token]]) -> None:
         super().__init__()
         self.digits_or_sum = digits_or_sum
 
+        # Numerators are built complete and never modified, so the sum is done once
+        value = 0
+        for obj in self.digits_or_sum:
+            if isinstance(obj, Number):
+                value += obj.value()
+        self._value = value
+
     def __str__(self) -> str:
         """Quick representation of the numerator for debugging."""
         return "".join(map(str, self.digits_or_sum))
@@ -1139,31 +1104,16 @@ class Numerator(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_numerator(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Numerator):
-            return False
-        return self._compare_lists(self.digits_or_sum, other.digits_or_sum)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Numerator, other)
-        self._compare_lists(self.digits_or_sum, other.digits_or_sum, True)
-
     def value(self) -> int:
-        value = 0
-        for obj in self.digits_or_sum:
-            if isinstance(obj, Number):
-                value += obj.value()
-        return value
+        return self._value
 
 
 class Denominator(SyntaxNode):
     """Represents a compound time signature denominator."""
 
+    __slots__ = ("digits",)
+    _CHILD_ATTRS = ("digits",)
+
     def __init__(self, digits: Number) -> None:
         super().__init__()
         self.digits = digits
@@ -1176,21 +1126,6 @@ class Denominator(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_denominator(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Denominator):
-            return False
-        return self.digits.compare(other.digits)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Denominator, other)
-
-        self.digits.compare_raise(other.digits)
-
     def value(self) -> int:
         return self.digits.value()
 
@@ -1198,10 +1133,19 @@ class Denominator(SyntaxNode):
 class Number(SyntaxNode):
     """Represents a number in the notation."""
 
+    __slots__ = ("digits", "_value")
+    _CHILD_ATTRS = ("digits",)
+
     def __init__(self, digits: List[Token]) -> None:
         super().__init__()
         self.digits = digits
 
+        # Numbers are built complete and never modified, so they are read once
+        value = 0
+        for digit in self.digits:
+            value = value * 10 + digit.modifiers["type"].value
+        self._value = value
+
     def __str__(self) -> str:
         """Quick representation of the numerator for debugging."""
         return "".join(map(str, self.digits))
@@ -1210,32 +1154,18 @@ class Number(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_number(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Number):
-            return False
-        return self._compare_lists(self.digits, other.digits)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Number, other)
-
-        self._compare_lists(self.digits, other.digits, True)
-
     def value(self) -> int:
         """Get the underlying value of the number."""
-        return sum(
-            x.modifiers["type"].value * (10**ii)
-            for ii, x in enumerate(reversed(self.digits))
-        )
+        return self._value
 
 
 class Clef(SyntaxNode):
     """Represents a clef symbol within the score."""
 
+    __slots__ = ("clef_token", "sign", "octave", "position", "_offset")
+    _CHILD_ATTRS = ("clef_token",)
+    _VALUE_ATTRS = ("sign", "octave", "position")
+
     def __init__(
         self,
         clef_token: Optional[Token],
@@ -1249,6 +1179,12 @@ class Clef(SyntaxNode):
         self.octave = octave
         self.position = position
 
+        # Clefs are not modified after being built, so the staff offset that every
+        # pitch conversion needs is computed once.
+        self._offset: Optional[int] = None
+        if position.position is not None:
+            self._offset = octave * _PITCHES_PER_OCTAVE + sign.value - position.position
+
     def __str__(self) -> str:
         """Quick representation of a clef for debugging."""
         return f"Clef: {str(self.clef_token)}"
@@ -1257,42 +1193,6 @@ class Clef(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_clef(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Clef):
-            return False
-
-        return (
-            self._compare_maybe(self.clef_token, other.clef_token)
-            and self.sign == other.sign
-            and self.octave == other.octave
-            and self.position == other.position
-        )
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Clef, other)
-
-        self._compare_maybe(self.clef_token, other.clef_token, True)
-        if not self.sign == other.sign:
-            raise ValueError(
-                f"Clef has the wrong sign: "
-                f"Expected {self.sign} but got {other.sign}"
-            )
-        if not self.octave == other.octave:
-            raise ValueError(
-                f"Clef has the wrong octave. "
-                f"Expected {self.octave} but got {other.octave}"
-            )
-        if not self.position == other.position:
-            raise ValueError(
-                f"Clef has the wrong position. "
-                f"Expected {self.position} but got {other.position}"
-            )
-
     def pitch2pos(self, pitch: MS.NotePitch) -> int:
         """Convert a full named pitch into a single staff-level position integer.
 
@@ -1307,16 +1207,10 @@ class Clef(SyntaxNode):
             The resulting position on the staff counting from the first ledger line
             below the staff.
         """
-        assert self.position.position is not None, "Uninitialised clef position"
-        offset = (
-            (self.octave * len(TT.NamedPitch))
-            + self.sign.value
-            - self.position.position
-        )
-        degree = pitch.step.value
-        octave = pitch.octave
+        offset = self._offset
+        assert offset is not None, "Uninitialised clef position"
 
-        return (octave * len(TT.NamedPitch) + degree) - offset
+        return (pitch.octave * _PITCHES_PER_OCTAVE + pitch.step.value) - offset
 
     def pos2pitch(self, pos: int) -> TT.NamedPitch:
         """Convert the position integer within a staff into a full musical pitch."""
@@ -1350,18 +1244,27 @@ class Clef(SyntaxNode):
 
     @classmethod
     def default_clef(cls, staff: int = 1) -> Clef:
-        return Clef(
-            None,
-            TT.NamedPitch.G,
-            MS.DEFAULT_CLEF_OCTAVE[TT.NamedPitch.G],
-            MS.StaffPosition(staff, 4),
-        )
+        """Return the shared default clef of a staff. It must not be modified."""
+        clef = _DEFAULT_CLEFS.get(staff)
+        if clef is None:
+            clef = Clef(
+                None,
+                TT.NamedPitch.G,
+                MS.DEFAULT_CLEF_OCTAVE[TT.NamedPitch.G],
+                MS.StaffPosition(staff, 4),
+            )
+            _DEFAULT_CLEFS[staff] = clef
+        return clef
 
 
 class Key(SyntaxNode):
     """Represents a key signature change within the score."""
 
-    RE_ACCIDENTAL = re.compile(r"accidental_(.*)")
+    __slots__ = ("naturals", "accidentals", "alterations", "fifths")
+    _CHILD_ATTRS = ("accidentals", "naturals")
+
+    # TODO: Key semantics are currently lost on re-loading MTN files, so comparisons
+    # only look at the drawn tokens. Alterations and fifths should be compared too.
 
     def __init__(
         self,
@@ -1385,7 +1288,7 @@ class Key(SyntaxNode):
             it, None by default.
         """
         super().__init__()
-        assert len(alterations) == len(TT.NamedPitch)
+        assert len(alterations) == _PITCHES_PER_OCTAVE
         self.naturals = naturals
         self.accidentals = accidentals
         self.alterations = alterations
@@ -1405,41 +1308,15 @@ class Key(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_key(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Key):
-            return False
-
-        # TODO: Key semantics are currently lost on re-loading MTN files, so this should
-        # be disabled now to avoid false positives during tests.
-        # if self.alterations != other.alterations:
-        #     return False
-
-        # if self.fifths != other.fifths:
-        #     return False
-
-        return self._compare_lists(
-            self.naturals, other.naturals
-        ) and self._compare_lists(self.accidentals, other.accidentals)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Key, other)
-
-        self._compare_lists(self.naturals, other.naturals, True)
-        self._compare_lists(self.accidentals, other.accidentals, True)
-
     def sort(self):
         """Sort key accidentals according to MTN criteria."""
-        self.naturals.sort(key=lambda x: int(x.position))
-        self.accidentals.sort(key=lambda x: int(x.position))
+        self.naturals.sort(key=_token_position)
+        self.accidentals.sort(key=_token_position)
 
     @classmethod
     def default_key(cls) -> Key:
-        return Key([], [], [None for _ in range(len(TT.NamedPitch))], 0)
+        """Return the shared default key. It must not be modified."""
+        return _DEFAULT_KEY
 
     # TODO: Factory methods from semantics to simplify conversion code
     @classmethod
@@ -1449,6 +1326,9 @@ class Key(SyntaxNode):
 class Direction(TopLevel):
     """Represents a direction within the score."""
 
+    __slots__ = ("directives",)
+    _CHILD_ATTRS = ("directives",)
+
     def __init__(
         self,
         delta: Fraction,
@@ -1465,25 +1345,6 @@ class Direction(TopLevel):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_direction(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Direction):
-            return False
-
-        if self.delta != other.delta:
-            return False
-
-        return self._compare_lists(self.directives, other.directives)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Direction, other)
-
-        self._compare_lists(self.directives, other.directives, True)
-
     def merge(self, other: Direction) -> None:
         """Combine two direction objects that happen simultaneously."""
         assert (
@@ -1495,18 +1356,25 @@ class Direction(TopLevel):
 
     def sort(self) -> None:
         """Sort internal elements according to MTN criteria."""
-        self.directives.sort(
-            key=lambda x: (
-                x.token_type.value + f"_{x.modifiers['type'].value}"
-                if "type" in x.modifiers
-                else ""
-            )
-        )
+        self.directives.sort(key=_directive_name)
 
 
 class Measure(SyntaxNode):
     """Represents a measure within the score."""
 
+    __slots__ = (
+        "elements",
+        "left_barline",
+        "right_barline",
+        "staves",
+        "measure_id",
+        "part_id",
+        "duration",
+    )
+    _CHILD_ATTRS = ("left_barline", "elements", "right_barline")
+    _COMPARE_ATTRS = ("left_barline", "right_barline", "elements")
+    _VALUE_ATTRS = ("measure_id", "part_id", "staves")
+
     def __init__(
         self,
         elements: List[TopLevel],
@@ -1536,57 +1404,26 @@ class Measure(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_measure(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Measure):
-            return False
-        if not self.measure_id == other.measure_id:
-            return False
-        if not self.part_id == other.part_id:
-            return False
-        if not self.staves == other.staves:
-            return False
-
-        return (
-            self._compare_lists(self.elements, other.elements)
-            and self._compare_maybe(self.left_barline, other.left_barline)
-            and self._compare_maybe(self.right_barline, other.right_barline)
-        )
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Measure, other)
-
-        self._compare_lists(self.elements, other.elements, True)
-        self._compare_maybe(self.left_barline, other.left_barline, True)
-        self._compare_maybe(self.right_barline, other.right_barline, True)
-
-        if not self.measure_id == other.measure_id:
-            raise ValueError(
-                f"Wrong Measure ID. "
-                f"Expected {self.measure_id} but got {other.measure_id}"
-            )
-        if not self.part_id == other.part_id:
-            raise ValueError(
-                f"Wrong Part ID. Expected {self.part_id} but got {other.part_id}"
-            )
-        if not self.staves == other.staves:
-            raise ValueError(
-                f"Wrong Number of Staves. "
-                f"Expected {self.staves} but got {other.staves}"
-            )
-
     def sort(self):
         """Sort internal elements according to MTN criteria."""
-        self.elements.sort()
+        # Deltas become integer ticks on a common grid, so the sort compares ints
+        # instead of Fractions. The order is the same as with TopLevel.sort_key.
+        ticks = lcm(*[x.delta.denominator for x in self.elements])
+        self.elements.sort(
+            key=lambda x: (
+                x.delta.numerator * (ticks // x.delta.denominator),
+                x._PRECEDENCE,
+                int(x.position()),
+            )
+        )
 
 
 class Barline(TopLevel):
     """Represents a measure within the score."""
 
+    __slots__ = ("barline_tokens", "modifiers")
+    _CHILD_ATTRS = ("barline_tokens", "modifiers")
+
     def __init__(
         self,
         delta: Fraction,
@@ -1605,31 +1442,13 @@ class Barline(TopLevel):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_barline(self)
-
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Barline):
-            return False
-        if not self.delta == other.delta:
-            return False
-
-        return self._compare_lists(
-            self.barline_tokens, other.barline_tokens
-        ) and self._compare_lists(self.modifiers, other.modifiers)
-
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Barline, other)
-
-        self._compare_lists(self.barline_tokens, other.barline_tokens, True)
-        self._compare_lists(self.modifiers, other.modifiers, True)
-
 
 class Score(SyntaxNode):
     """Represents a measure within the score."""
 
+    __slots__ = ("measures", "score_id")
+    _CHILD_ATTRS = ("measures",)
+
     def __init__(
         self,
         measures: List[Measure],
@@ -1647,25 +1466,21 @@ class Score(SyntaxNode):
         """Quick representation of the token for debugging."""
         return str(self)
 
-    def accept(self, visitor: Visitor) -> Any:
-        """Have visitor perform operation on node."""
-        return visitor.visit_score(self)
 
-    def compare(self, other: SyntaxNode) -> bool:
-        if not isinstance(other, Score):
-            return False
+def _token_position(token: Token) -> int:
+    return token._position_int
 
-        # Not really useful
-        # if not self.score_id == other.score_id:
-        #     return False
 
-        return self._compare_lists(self.measures, other.measures)
+def _directive_name(token: Token) -> str:
+    # Typed directives sort by token and modifier type. Untyped ones go first.
+    mod = token.modifiers.get("type")
+    if mod is None:
+        return ""
+    return f"{token.token_type.value}_{mod.value}"
 
-    def compare_raise(self, other: SyntaxNode) -> None:
-        super().compare_raise(other)
-        other = cast(Score, other)
 
-        self._compare_lists(self.measures, other.measures, True)
+def _notehead_position(note: Note) -> int:
+    return note.notehead._position_int
 
 
 _OBJECT_PRECEDENCE: Dict[Type[TopLevel], int] = {
@@ -1675,3 +1490,35 @@ _OBJECT_PRECEDENCE: Dict[Type[TopLevel], int] = {
     Rest: 4,
     NoteGroup: 5,
 }
+
+for _cls, _precedence in _OBJECT_PRECEDENCE.items():
+    _cls._PRECEDENCE = _precedence
+del _cls, _precedence
+
+# Default attributes are requested once per staff whenever attributes are created or
+# resized. Nothing modifies them in place, so a single instance of each is shared.
+_DEFAULT_KEY = Key([], [], [None] * _PITCHES_PER_OCTAVE, 0)
+_DEFAULT_TIMESIG = TimeSignature(None, None, Fraction(4, 1))
+_DEFAULT_CLEFS: Dict[int, Clef] = {}
+
+_VISIT_METHODS: Dict[Type[SyntaxNode], str] = {
+    Score: "visit_score",
+    Measure: "visit_measure",
+    Barline: "visit_barline",
+    Attributes: "visit_attributes",
+    Key: "visit_key",
+    Clef: "visit_clef",
+    TimeSignature: "visit_time_signature",
+    TimesigFraction: "visit_timesig_fraction",
+    Numerator: "visit_numerator",
+    Denominator: "visit_denominator",
+    Number: "visit_number",
+    Direction: "visit_direction",
+    Rest: "visit_rest",
+    NoteGroup: "visit_note_group",
+    Chord: "visit_chord",
+    Note: "visit_note",
+    Tuplet: "visit_tuplet",
+    Token: "visit_token",
+    TopLevel: "visit_toplevel",
+}
@@ -19,11 +19,9 @@ Helper classes for music semantic processing.
 """
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass
 from fractions import Fraction
-from functools import total_ordering
-from math import ceil
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
 
 from . import types as TT
@@ -31,6 +29,11 @@ from . import types as TT
 if TYPE_CHECKING:
     from . import ast as AST
 
+PITCHES_PER_OCTAVE = len(TT.NamedPitch)
+
+# Named pitches indexed by their value, which is cheaper than calling the enum
+_NAMED_PITCHES = tuple(TT.NamedPitch)
+
 CLEF2SIGN = {
     TT.ClefType.CLEF_G: TT.NamedPitch.G,
     TT.ClefType.CLEF_C: TT.NamedPitch.C,
@@ -49,6 +52,8 @@ SYMBOL_TIMESIG_DUR = {
 class NotePitch:
     """Represents the pitch of a Note using CWMN semantics."""
 
+    __slots__ = ("step", "octave", "alter")
+
     step: TT.NamedPitch
     octave: int
     alter: Fraction
@@ -62,7 +67,7 @@ class NotePitch:
             The real value of the pitch considering all of the possible notes in the
             keyboard range. Does not consider alterations.
         """
-        return self.step.value + (len(TT.NamedPitch) * self.octave)
+        return self.step.value + (PITCHES_PER_OCTAVE * self.octave)
 
     def __sub__(
         self,
@@ -82,10 +87,10 @@ class NotePitch:
         """
         diff = self.step.value - val
 
-        octaves = diff // len(TT.NamedPitch)
-        new_pitch = diff % len(TT.NamedPitch)
+        octaves = diff // PITCHES_PER_OCTAVE
+        new_pitch = diff % PITCHES_PER_OCTAVE
 
-        return NotePitch(TT.NamedPitch(new_pitch), self.octave - octaves, self.alter)
+        return NotePitch(_NAMED_PITCHES[new_pitch], self.octave - octaves, self.alter)
 
     def __add__(
         self,
@@ -105,17 +110,18 @@ class NotePitch:
         """
         diff = self.step.value + val
 
-        octaves = diff // len(TT.NamedPitch)
-        new_pitch = diff % len(TT.NamedPitch)
+        octaves = diff // PITCHES_PER_OCTAVE
+        new_pitch = diff % PITCHES_PER_OCTAVE
 
-        return NotePitch(TT.NamedPitch(new_pitch), self.octave - octaves, self.alter)
+        return NotePitch(_NAMED_PITCHES[new_pitch], self.octave - octaves, self.alter)
 
 
-@total_ordering
 class StaffPosition(NamedTuple):
     """Represents the position of an element in a staff using MTN semantics.
 
-    Uses a namedtuple instead of a dataclass for hashing purposes.
+    Uses a namedtuple instead of a dataclass for hashing purposes. Positions compare
+    and hash by their integer value, so every comparison operator is defined here
+    instead of falling back to the field-wise comparisons of tuples.
     """
 
     staff: int | None
@@ -129,17 +135,10 @@ class StaffPosition(NamedTuple):
         int
             A specific position determined by a single int value.
         """
-        if self.staff is None:
-            staff = 0
-        else:
-            staff = self.staff
-
-        if self.position is None:
-            position = 500
-        else:
-            position = self.position
-
-        return 1000 * staff + position
+        staff, position = self
+        return 1000 * (0 if staff is None else staff) + (
+            500 if position is None else position
+        )
 
     def __str__(self) -> str:
         """Convert staff position into a string."""
@@ -151,24 +150,56 @@ class StaffPosition(NamedTuple):
             position = f"{self.position:02}"
         return f"s:{staff}/p:{position}"
 
+    def __copy__(self) -> StaffPosition:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> StaffPosition:
+        # Both fields are ints or None, so a position can be shared by any number of
+        # copies. Otherwise deepcopy rebuilds tuple subclasses through __reduce_ex__.
+        return self
+
+    def __hash__(self) -> int:
+        return int(self)
+
     def __eq__(self, value: object, /) -> bool:
         if not isinstance(value, StaffPosition):
             return False
         return int(self) == int(value)
 
+    def __ne__(self, value: object, /) -> bool:
+        if not isinstance(value, StaffPosition):
+            return True
+        return int(self) != int(value)
+
     def __lt__(self, value: tuple[Any, ...], /) -> bool:
         if isinstance(value, StaffPosition):
             return int(self) < int(value)
         return False
 
+    def __le__(self, value: tuple[Any, ...], /) -> bool:
+        if isinstance(value, StaffPosition):
+            return int(self) <= int(value)
+        return False
 
-def _compute_alterations() -> List[List[Optional[TT.AccidentalType]]]:
+    def __gt__(self, value: tuple[Any, ...], /) -> bool:
+        if isinstance(value, StaffPosition):
+            return int(self) > int(value)
+        return False
+
+    def __ge__(self, value: tuple[Any, ...], /) -> bool:
+        if isinstance(value, StaffPosition):
+            return int(self) >= int(value)
+        return False
+
+
+def _compute_alterations() -> Tuple[Tuple[Optional[TT.AccidentalType], ...], ...]:
     has_alteration: List[List[Optional[TT.AccidentalType]]] = [
         [TT.AccidentalType.ACC_FLAT for _ in range(7)]
     ]
     mod_pitch = 3
     for _ in range(14):
-        has_alteration.append(deepcopy(has_alteration[-1]))
+        # Accidental types are immutable, so a shallow copy is enough
+        has_alteration.append(list(has_alteration[-1]))
         if has_alteration[-1][mod_pitch] is None:
             has_alteration[-1][mod_pitch] = TT.AccidentalType.ACC_SHARP
         elif has_alteration[-1][mod_pitch] == TT.AccidentalType.ACC_FLAT:
@@ -176,11 +207,11 @@ def _compute_alterations() -> List[List[Optional[TT.AccidentalType]]]:
 
         mod_pitch = (mod_pitch + 4) % 7
 
-    return has_alteration
+    return tuple(tuple(row) for row in has_alteration)
 
 
-def _compute_modifications() -> List[int]:
-    return [((x * 4) + 3) % 7 for x in range(14)]
+def _compute_modifications() -> Tuple[int, ...]:
+    return tuple(((x * 4) + 3) % 7 for x in range(14))
 
 
 ACCIDENTAL_ALTER = {
@@ -221,6 +252,22 @@ class MusicalKey:
         (TT.NamedPitch.C, 8): [7, 10, 6, 9, 5, 8, 4],
     }
 
+    # Order in which sharps and flats are added to a key signature, and the lowest
+    # position they take on the staff when a clef has no layout of its own above. The
+    # lowest positions follow the layout of the G clef.
+    SHARP_ORDER: Tuple[TT.NamedPitch, ...] = (
+        TT.NamedPitch.F,
+        TT.NamedPitch.C,
+        TT.NamedPitch.G,
+        TT.NamedPitch.D,
+        TT.NamedPitch.A,
+        TT.NamedPitch.E,
+        TT.NamedPitch.B,
+    )
+    FLAT_ORDER: Tuple[TT.NamedPitch, ...] = SHARP_ORDER[::-1]
+    LOWEST_SHARP_POSITION = 5
+    LOWEST_FLAT_POSITION = 3
+
     def __init__(self, alters: List[float]) -> None:
         self.key = alters
 
@@ -232,6 +279,9 @@ class MusicalKey:
     ) -> List[int]:
         """Compute accidental positions for a given clef and set of fifths.
 
+        Results are cached on the number of fifths and the clef configuration, so the
+        returned list is shared and must not be modified.
+
         Parameters
         ----------
         fifths : int
@@ -244,36 +294,48 @@ class MusicalKey:
         List[int]
             List of positions for each accidental.
         """
+        assert clef.position.position is not None
+        assert clef.sign is not None
+        return cls._accidental_positions(fifths, clef.sign, clef.position.position)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _accidental_positions(
+        cls,
+        fifths: int,
+        sign: TT.NamedPitch,
+        position: int,
+    ) -> List[int]:
         if fifths > 0:
             accidental_dict = cls.SHARP_POSITIONS
-            direction = 1
+            order = cls.SHARP_ORDER
+            lowest = cls.LOWEST_SHARP_POSITION
         else:
             accidental_dict = cls.FLAT_POSITIONS
-            direction = -1
+            order = cls.FLAT_ORDER
+            lowest = cls.LOWEST_FLAT_POSITION
 
-        assert clef.position.position is not None
-        assert clef.sign is not None
         try:
-            return accidental_dict[(clef.sign, clef.position.position)][: abs(fifths)]
+            return accidental_dict[(sign, position)][: abs(fifths)]
         except KeyError:
             ...
 
-        accidentals = [
-            clef.pitch2pos(
-                NotePitch(
-                    TT.NamedPitch(ii + (5 * direction) % len(TT.NamedPitch)),
-                    clef.octave + direction,
-                    Fraction(0),
-                )
-            )
-            for ii in range(1, 8)
+        # The clef sign sits at its position, so every other step is placed relative to
+        # it and wrapped into the seven positions starting at the lowest one.
+        shift = position - sign.value - lowest
+        return [
+            (step.value + shift) % PITCHES_PER_OCTAVE + lowest
+            for step in order[: abs(fifths)]
         ]
-        return list(map(cls.ensure_range, accidentals))
 
     @classmethod
+    @lru_cache(maxsize=None)
     def fifths_alterations(cls, fifths: int) -> List[Optional[TT.AccidentalType]]:
         """Get the alterations that would be produced on scale tones after x fifths.
 
+        There are only fifteen possible keys, so results are cached. Every Key with
+        the same signature shares the same list, which must not be modified.
+
         Parameters
         ----------
         fifths : int
@@ -286,9 +348,7 @@ class MusicalKey:
             A list of length 7 where each element is a tone and its contents the
             required alterations. None means no alteration on that tone.
         """
-        output: List[Optional[TT.AccidentalType]] = [
-            None for _ in range(len(TT.NamedPitch))
-        ]
+        output: List[Optional[TT.AccidentalType]] = [None] * PITCHES_PER_OCTAVE
         origin = 7
         target = origin + fifths
         if target < origin:
@@ -304,11 +364,15 @@ class MusicalKey:
 
     @classmethod
     def ensure_range(cls, value: int) -> int:
-        """Ensure the accidental is within the acceptable range of positions."""
+        """Ensure the accidental is within the acceptable range of positions.
+
+        Values above the range are moved down into [4, 11] and values below it up into
+        [1, 8], in steps of eight positions.
+        """
         if value > 11:
-            value -= 8 * ceil((value - 11) / 8)
-        elif value < 1:
-            value += 8 * ceil(-(value - 1) / 8)
+            return (value - 4) % 8 + 4
+        if value < 1:
+            return (value - 1) % 8 + 1
         return value
 
 
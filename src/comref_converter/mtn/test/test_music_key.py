@@ -37,3 +37,63 @@ class TestMusicalKey(unittest.TestCase):
             with self.subTest(i=ii):
                 positions = MS.MusicalKey.fifths_accidental_positions(fifths, clef)
                 self.assertEqual(positions, gt, f"Subtest {ii} failed")
+
+    def test_fifths_accidental_positions_other_clef(self) -> None:
+        """Test positions of accidentals on a clef without a fixed layout."""
+        # French violin clef: a G clef on the first line
+        clef = Clef(None, TT.NamedPitch.G, 4, position=MS.StaffPosition(1, 2))
+
+        test_cases = [
+            # fifths, result
+            (7, [8, 5, 9, 6, 10, 7, 11]),
+            (-3, [4, 7, 3]),
+            (0, []),
+        ]
+        for ii, (fifths, gt) in enumerate(test_cases):
+            with self.subTest(i=ii):
+                positions = MS.MusicalKey.fifths_accidental_positions(fifths, clef)
+                self.assertEqual(positions, gt, f"Subtest {ii} failed")
+
+    def test_ensure_range(self) -> None:
+        """Test that positions out of range are moved in steps of eight."""
+        test_cases = [
+            # value, result
+            (5, 5),
+            (11, 11),
+            (12, 4),
+            (19, 11),
+            (20, 4),
+            (1, 1),
+            (0, 8),
+            (-7, 1),
+            (-8, 8),
+        ]
+        for value, gt in test_cases:
+            with self.subTest(value=value):
+                self.assertEqual(MS.MusicalKey.ensure_range(value), gt)
+
+    def test_fifths_accidental_positions_shared(self) -> None:
+        """Test that equivalent clefs share the cached accidental positions."""
+        clef = Clef(None, TT.NamedPitch.G, 4, position=MS.StaffPosition(1, 4))
+        other = Clef(None, TT.NamedPitch.G, 4, position=MS.StaffPosition(2, 4))
+
+        positions = MS.MusicalKey.fifths_accidental_positions(3, clef)
+        self.assertEqual(positions, [10, 7, 11])
+        self.assertIs(MS.MusicalKey.fifths_accidental_positions(3, other), positions)
+
+    def test_fifths_alterations(self) -> None:
+        """Test alterations of standard keys, which are shared between calls."""
+        sharp = TT.AccidentalType.ACC_SHARP
+        flat = TT.AccidentalType.ACC_FLAT
+
+        test_cases = [
+            # fifths, result
+            (0, [None] * 7),
+            (1, [None, None, None, sharp, None, None, None]),
+            (-2, [None, None, flat, None, None, None, flat]),
+        ]
+        for ii, (fifths, gt) in enumerate(test_cases):
+            with self.subTest(i=ii):
+                alterations = MS.MusicalKey.fifths_alterations(fifths)
+                self.assertEqual(alterations, gt, f"Subtest {ii} failed")
+                self.assertIs(alterations, MS.MusicalKey.fifths_alterations(fifths))
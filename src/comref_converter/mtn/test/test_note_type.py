@@ -0,0 +1,42 @@
+"""Test conversions between note types and durations."""
+
+import unittest
+from fractions import Fraction
+
+from .. import types as TT
+
+
+class TestNoteType(unittest.TestCase):
+    """Test note type lookups."""
+
+    def test_duration2type(self) -> None:
+        """Test that durations are rounded up to the closest note type."""
+        test_cases = [
+            # Duration, Expected type
+            (Fraction(1, 4), TT.NoteType.NT_QUARTER),
+            (Fraction(8), TT.NoteType.NT_MAXIMA),
+            (Fraction(1, 1024), TT.NoteType.NT_1024TH),
+            (Fraction(3, 8), TT.NoteType.NT_HALF),
+            (Fraction(1, 6), TT.NoteType.NT_QUARTER),
+            (Fraction(5, 4), TT.NoteType.NT_BREVE),
+            (Fraction(16), TT.NoteType.NT_WHOLE),
+            (Fraction(1, 2048), TT.NoteType.NT_WHOLE),
+        ]
+        for dur, ntype in test_cases:
+            with self.subTest(duration=dur):
+                self.assertEqual(TT.NoteType.duration2type(dur), ntype)
+
+    def test_duration2type_not_positive(self) -> None:
+        """Test that durations without a note type are rejected."""
+        for dur in [Fraction(0), Fraction(-1, 4), Fraction(-8)]:
+            with self.subTest(duration=dur):
+                with self.assertRaises(ValueError):
+                    TT.NoteType.duration2type(dur)
+
+    def test_type2duration_roundtrip(self) -> None:
+        """Test that every note type maps back from its own duration."""
+        for ntype in TT.NoteType:
+            with self.subTest(ntype=ntype):
+                self.assertEqual(
+                    TT.NoteType.duration2type(TT.NoteType.type2duration(ntype)), ntype
+                )
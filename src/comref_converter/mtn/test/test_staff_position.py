@@ -0,0 +1,46 @@
+"""Test staff position comparisons."""
+
+import unittest
+from copy import copy, deepcopy
+
+from .. import semantics as MS
+
+
+class TestStaffPosition(unittest.TestCase):
+    """Test that staff positions behave as their integer value."""
+
+    def test_comparisons(self) -> None:
+        """Test that every comparison operator agrees with the integer value."""
+        positions = [
+            MS.StaffPosition(None, None),
+            MS.StaffPosition(0, None),
+            MS.StaffPosition(None, 500),
+            MS.StaffPosition(1, None),
+            MS.StaffPosition(1, 4),
+            MS.StaffPosition(2, -1),
+        ]
+        for first in positions:
+            for second in positions:
+                with self.subTest(first=str(first), second=str(second)):
+                    self.assertEqual(first == second, int(first) == int(second))
+                    self.assertEqual(first != second, int(first) != int(second))
+                    self.assertEqual(first < second, int(first) < int(second))
+                    self.assertEqual(first <= second, int(first) <= int(second))
+                    self.assertEqual(first > second, int(first) > int(second))
+                    self.assertEqual(first >= second, int(first) >= int(second))
+
+    def test_hash(self) -> None:
+        """Test that equal positions can be used interchangeably as keys."""
+        ties = {MS.StaffPosition(0, None): "tie"}
+        self.assertEqual(ties[MS.StaffPosition(None, 500)], "tie")
+
+    def test_tuple_unpacking(self) -> None:
+        """Test that positions can still be unpacked as tuples."""
+        staff, position = MS.StaffPosition(1, 4)
+        self.assertEqual((staff, position), (1, 4))
+
+    def test_copy_shares_position(self) -> None:
+        """Test that copying an immutable position returns the same object."""
+        position = MS.StaffPosition(1, 4)
+        self.assertIs(copy(position), position)
+        self.assertIs(deepcopy(position), position)
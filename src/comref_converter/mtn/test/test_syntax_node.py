@@ -0,0 +1,220 @@
+"""Test generic traversal and restructuring of syntax trees."""
+
+import sys
+import unittest
+import xml.etree.ElementTree as ET
+from fractions import Fraction
+from pathlib import Path
+from typing import List
+
+from ...translator_xml import TranslatorXML
+from ...visitor_get_nodes import VisitorGetNodes
+from .. import semantics as MS
+from .. import types as TT
+from ..ast import (Attributes, Barline, Clef, Measure, NoteGroup, Number,
+                   SyntaxNode, Token, Visitor)
+
+
+class TestSyntaxNode(unittest.TestCase):
+    """Test iterative traversal helpers on reference MTN files."""
+
+    REFERENCES = sorted((Path(__file__).parents[3] / "test").glob("*_reference.mtn"))
+
+    def setUp(self) -> None:
+        translator = TranslatorXML()
+        self.scores = []
+        for reference in self.REFERENCES:
+            root = ET.parse(reference).getroot()
+            self.scores.append(translator.translate(root, reference.stem, set()))
+            translator.reset()
+
+    def test_generic_visit(self) -> None:
+        """Test that nodes without a visiting method have their children visited."""
+
+        class Wrapper(SyntaxNode):
+            __slots__ = ("inner",)
+            _CHILD_ATTRS = ("inner",)
+
+            def __init__(self, inner: SyntaxNode) -> None:
+                self.inner = inner
+
+        class TokenCollector(Visitor):
+            def __init__(self) -> None:
+                super().__init__()
+                self.tokens: List[Token] = []
+
+            def visit_token(self, token: Token) -> None:
+                self.tokens.append(token)
+
+        token = Token(
+            TT.TokenType.BARLINE,
+            {"type": TT.BarlineType.BL_REGULAR},
+            MS.StaffPosition(None, None),
+            1,
+        )
+        collector = TokenCollector()
+
+        self.assertIsNone(collector.visit(Wrapper(Wrapper(token))))
+        self.assertIsNone(Wrapper(token).accept(collector))
+        self.assertEqual(collector.tokens, [token, token])
+
+    def test_iter_descendants(self) -> None:
+        """Test that every node reachable through a visitor is yielded once."""
+        for score in self.scores:
+            for measure in score.measures:
+                with self.subTest(score=score.score_id, measure=measure.measure_id):
+                    descendants = [id(x) for x in measure.iter_descendants()]
+                    self.assertEqual(len(descendants), len(set(descendants)))
+                    self.assertEqual(
+                        {id(measure), *descendants},
+                        {id(x) for x in VisitorGetNodes().visit_ast(measure)},
+                    )
+
+    def test_simplify_deep_nesting(self) -> None:
+        """Test simplifying groups nested deeper than the recursion limit."""
+        group = next(
+            x
+            for score in self.scores
+            for measure in score.measures
+            for x in measure.elements
+            if isinstance(x, NoteGroup)
+        )
+        children = list(group.children)
+
+        outer = group
+        for _ in range(sys.getrecursionlimit() + 10):
+            outer = NoteGroup(group.delta, [outer], [])
+        outer.simplify()
+
+        self.assertEqual([id(x) for x in outer.children], [id(x) for x in children])
+        self.assertEqual(id(outer.get_first_chord()), id(group.get_first_chord()))
+
+    def test_measure_sort(self) -> None:
+        """Test that sorting by key matches sorting by comparison."""
+        for score in self.scores:
+            for measure in score.measures:
+                with self.subTest(score=score.score_id, measure=measure.measure_id):
+                    expected = [id(x) for x in sorted(reversed(measure.elements))]
+                    measure.elements.reverse()
+                    measure.sort()
+                    self.assertEqual([id(x) for x in measure.elements], expected)
+
+    def test_compare_lists(self) -> None:
+        """Test that sequences of different lengths never compare equal."""
+        elements = self.scores[0].measures[0].elements
+
+        self.assertTrue(SyntaxNode._compare_lists(elements, list(elements)))
+        self.assertFalse(SyntaxNode._compare_lists(elements, elements[:-1]))
+        with self.assertRaises(ValueError):
+            SyntaxNode._compare_lists(elements, elements[:-1], True)
+
+    def test_compare_children(self) -> None:
+        """Test the generic comparison of child attributes."""
+        for score in self.scores:
+            with self.subTest(score=score.score_id):
+                self.assertTrue(score.compare(score))
+                score.compare_raise(score)
+
+        measure = self.scores[0].measures[0]
+        shorter = Measure(
+            measure.elements[:-1],
+            measure.left_barline,
+            measure.right_barline,
+            measure.staves,
+            measure.measure_id,
+            measure.part_id,
+            measure.duration,
+        )
+
+        self.assertFalse(measure.compare(shorter))
+        with self.assertRaises(ValueError):
+            measure.compare_raise(shorter)
+        self.assertFalse(measure.compare(self.scores[0]))
+        with self.assertRaises(TypeError):
+            measure.compare_raise(self.scores[0])
+
+        # Barlines are checked before the elements, yet children keep the MTN order
+        barline = Barline(measure.duration, [], [])
+        different = Measure(
+            measure.elements[:-1],
+            measure.left_barline,
+            barline if measure.right_barline is None else None,
+            measure.staves,
+            measure.measure_id,
+            measure.part_id,
+            measure.duration,
+        )
+        with self.assertRaisesRegex(ValueError, "The generated object is"):
+            measure.compare_raise(different)
+        self.assertEqual(
+            Measure._CHILD_ATTRS, ("left_barline", "elements", "right_barline")
+        )
+
+        self.assertFalse(Clef.default_clef(1).compare(Clef.default_clef(2)))
+        with self.assertRaises(ValueError):
+            Clef.default_clef(1).compare_raise(Clef.default_clef(2))
+
+    def test_token_set_modifier(self) -> None:
+        """Test that changing a modifier refreshes the token representation."""
+        token = Token(TT.TokenType.NOTEHEAD, {}, MS.StaffPosition(1, 0), 0)
+        self.assertEqual(str(token), "notehead")
+
+        token.set_modifier("grace", True)
+        self.assertEqual(str(token), "notehead_grace")
+
+    def test_token_position(self) -> None:
+        """Test that moving a token keeps its sorting position up to date."""
+        token = Token(TT.TokenType.NOTEHEAD, {}, MS.StaffPosition(1, 0), 0)
+        self.assertEqual(token._position_int, int(MS.StaffPosition(1, 0)))
+
+        token.position = MS.StaffPosition(2, 3)
+        self.assertEqual(token.position, MS.StaffPosition(2, 3))
+        self.assertEqual(token._position_int, int(MS.StaffPosition(2, 3)))
+
+    def test_default_attributes(self) -> None:
+        """Test that default attribute objects are shared between staves."""
+        attributes = Attributes.make_empty(2, Fraction(0), init_default=True)
+
+        self.assertIs(attributes.get_key(1), attributes.get_key(2))
+        self.assertIs(attributes.get_timesig(1), attributes.get_timesig(2))
+        self.assertIs(attributes.get_clef(2), Clef.default_clef(2))
+        self.assertEqual(attributes.get_clef(2).position, MS.StaffPosition(2, 4))
+
+    def test_number_value(self) -> None:
+        """Test that multi-digit numbers read their digits most significant first."""
+        digits = [
+            Token(
+                TT.TokenType.NUMBER, {"type": TT.Digits(x)}, MS.StaffPosition(1, 0), x
+            )
+            for x in (1, 0, 7)
+        ]
+        self.assertEqual(Number(digits).value(), 107)
+        self.assertEqual(Number(digits[1:]).value(), 7)
+
+    def test_shared_deltas(self) -> None:
+        """Test that equal deltas are stored as the same Fraction object."""
+        first = Attributes.make_empty(1, Fraction(3, 4))
+        second = Attributes.make_empty(1, Fraction(6, 8))
+        self.assertIs(first.delta, second.delta)
+
+    def test_attributes_merge(self) -> None:
+        """Test that merging attributes only overrides the staves that are set."""
+        base = Attributes.make_empty(2, Fraction(0), init_default=True)
+        change = Attributes.make_empty(2, Fraction(1, 2))
+        clef = Clef.default_clef(2)
+        change.set_clef(clef, 2)
+
+        merged = base.copy()
+        merged.merge(change)
+
+        self.assertEqual(merged.delta, Fraction(1, 2))
+        self.assertIs(merged.get_clef(1), base.get_clef(1))
+        self.assertIs(merged.get_clef(2), clef)
+        self.assertEqual(merged.key, base.key)
+        self.assertIsNot(merged.key, base.key)
+
+        merged.change_staves(1, True)
+        self.assertEqual(len(merged.clef), 1)
+        merged.change_staves(3, True)
+        self.assertEqual(len(merged.timesig), 3)
+        self.assertIsNotNone(merged.get_timesig(3))
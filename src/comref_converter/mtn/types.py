@@ -22,7 +22,6 @@ from __future__ import annotations
 
 from enum import Enum, unique
 from fractions import Fraction
-from math import ceil, log
 from typing import Optional
 
 
@@ -121,14 +120,14 @@ class NoteType(Enum):
 
     @classmethod
     def duration2type(cls, dur: Fraction) -> NoteType:
-        """Return the note type class for a specified duration."""
-        try:
-            return DURATION2TYPE[dur]
-        except KeyError:
-            try:
-                return DURATION2TYPE[cls._closest_pow2(dur)]
-            except KeyError:
-                return NoteType.NT_WHOLE
+        """Return the note type class for a specified duration.
+
+        Durations that are not a power of two are rounded up to the next one. Raises
+        ValueError if the duration is not positive.
+        """
+        if dur <= 0:
+            raise ValueError(f"Note durations must be positive, got {dur}")
+        return EXPONENT2TYPE.get(cls._ceil_log2(dur), NoteType.NT_WHOLE)
 
     @classmethod
     def beams2type(cls, nbeams: int) -> NoteType:
@@ -140,13 +139,19 @@ class NoteType(Enum):
         """Get the number of beams based on the note type."""
         return TYPE2BEAM.get(ntype, None)
 
-    @classmethod
-    def _closest_pow2(cls, dur: Fraction) -> Fraction:
-        exponent = ceil(log(dur, 2))
+    @staticmethod
+    def _ceil_log2(dur: Fraction) -> int:
+        """Return the smallest exponent such that 2 ** exponent >= dur.
+
+        Works on the numerator and denominator directly, so no float logarithm or
+        intermediate Fraction is needed.
+        """
+        num, den = dur.numerator, dur.denominator
+        exponent = num.bit_length() - den.bit_length()
 
         if exponent >= 0:
-            return Fraction(2**exponent)
-        return Fraction(1, 2**-exponent)
+            return exponent + (num > den << exponent)
+        return exponent + ((num << -exponent) > den)
 
 
 TYPE2DURATION = {
@@ -166,6 +171,7 @@ TYPE2DURATION = {
     NoteType.NT_1024TH: Fraction(1, 1024),
 }
 DURATION2TYPE = {dur: typ for typ, dur in TYPE2DURATION.items()}
+EXPONENT2TYPE = {NoteType._ceil_log2(dur): typ for typ, dur in TYPE2DURATION.items()}
 
 BEAM2TYPE = {x - 2: DURATION2TYPE[Fraction(1, 2**x)] for x in range(2, 11)}
 TYPE2BEAM = {typ: num for num, typ in BEAM2TYPE.items()}
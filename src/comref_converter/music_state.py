@@ -20,15 +20,18 @@ Keeps track of the state of the score during parsing.
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from copy import deepcopy
 from fractions import Fraction
-from typing import List, Optional, Tuple
-
-from sortedcontainers import SortedDict
+from typing import Dict, List, Optional, Tuple
 
 from . import symbol_table as ST
 from .mtn import ast as AST
 
+# Fractions are immutable, so a single zero is shared by every state and translator.
+# Measures then start at the very object that keys the start of the attribute stack.
+ZERO = Fraction(0)
+
 
 class ScoreState:
     """Contain the state of a single part of the score."""
@@ -36,8 +39,8 @@ class ScoreState:
     def __init__(self) -> None:
         self.nstaves = 1
         self.divisions = 1
-        self.current_time = Fraction(0)
-        self.time_buffer: Fraction = Fraction(0)
+        self.current_time = ZERO
+        self.time_buffer: Fraction = ZERO
 
         # The initial state for a measure. Posterior attributes are computed by
         # composing these initial attributes with a stack of saved attribute elements.
@@ -46,10 +49,15 @@ class ScoreState:
         )
 
         # The attributes at the current time step (composing the initial state with
-        # the stack of states).
-        self.current_attributes: AST.Attributes = self.initial_attributes.copy()
+        # the stack of states). They are the initial attributes themselves until
+        # something is merged into them, see _own_attributes.
+        self.current_attributes: AST.Attributes = self.initial_attributes
+        self._shared_attributes = True
 
-        self.stack: SortedDict[Fraction, AST.Attributes] = SortedDict()
+        # Attribute changes within the measure by time. There are only a handful per
+        # measure, so their times are kept sorted in a plain list next to them.
+        self.stack: Dict[Fraction, AST.Attributes] = {}
+        self._stack_times: List[Fraction] = []
 
     def __str__(self) -> str:
         """Get simple representation for debugging purposes."""
@@ -60,7 +68,7 @@ class ScoreState:
         ) + "\n - - -\n".join(
             map(
                 lambda x: f"({x[0]}) Delta {str(x[1][0])}: {x[1][0]}",
-                enumerate(self.stack.items()),
+                enumerate((x, self.stack[x]) for x in self._stack_times),
             )
         )
 
@@ -85,16 +93,29 @@ class ScoreState:
         attributes : AST.Attributes
             Attributes object currently in use.
         """
-        if self.current_time in self.stack:
-            self.stack[self.current_time].merge(attributes)
+        existing = self.stack.get(self.current_time)
+        if existing is not None:
+            existing.merge(attributes)
         else:
             self.stack[self.current_time] = attributes
+            insort(self._stack_times, self.current_time)
 
+        self._own_attributes()
         self.current_attributes.merge(attributes)
 
+    def _own_attributes(self) -> None:
+        """Copy the initial attributes into the current ones before modifying them.
+
+        Most measures do not change attributes at all, so the copy is deferred until
+        the current attributes actually diverge from the initial ones.
+        """
+        if self._shared_attributes:
+            self.current_attributes = self.initial_attributes.copy()
+            self._shared_attributes = False
+
     @property
     def attribute_list(self) -> List[AST.Attributes]:
-        return list(self.stack.values())
+        return [self.stack[x] for x in self._stack_times]
 
     def increment_time(self, increment: Fraction) -> None:
         """Move the internal time by a set increment (positive or negative).
@@ -120,23 +141,28 @@ class ScoreState:
         time : Fraction
             What time to move the state to.
         """
+        # Keys are exact fractions, so bisecting on time itself tells apart the states
+        # before, at and after it.
         if time < self.current_time:
             if len(self.stack) > 0:
-                index = self.stack.bisect_left(time + Fraction(1, 32782))
-                self.current_attributes = self.initial_attributes.copy()
+                index = bisect_right(self._stack_times, time)
+                self.current_attributes = self.initial_attributes
+                self._shared_attributes = True
 
-                for intermediate in self.stack.keys()[:index]:
+                for intermediate in self._stack_times[:index]:
+                    self._own_attributes()
                     self.current_attributes.merge(self.stack[intermediate])
         else:
             if len(self.stack) > 0:
-                right_index = self.stack.bisect_left(time + Fraction(1, 32782))
-                left_index = self.stack.bisect_right(time - Fraction(1, 32782))
+                right_index = bisect_right(self._stack_times, time)
+                left_index = bisect_left(self._stack_times, time)
 
-                for intermediate in self.stack.keys()[left_index:right_index]:
+                for intermediate in self._stack_times[left_index:right_index]:
+                    self._own_attributes()
                     self.current_attributes.merge(self.stack[intermediate])
 
         self.current_time = time
-        self.time_buffer = Fraction(0)
+        self.time_buffer = ZERO
 
     def set_buffer(self, buffer: Fraction) -> None:
         """Set a value for the time buffer.
@@ -155,7 +181,7 @@ class ScoreState:
 
     def move_buffer(self) -> None:
         """Update the current time with the buffer and reset the latter."""
-        if self.time_buffer != Fraction(0):
+        if self.time_buffer.numerator != 0:
             new_time = self.current_time + self.time_buffer
             self.change_time(new_time)
 
@@ -167,45 +193,45 @@ class ScoreState:
         nstaves : int
             The number of staves to change the part to.
         """
-        assert self.current_time == Fraction(0), "Changing number of staves mid-measure"
+        assert self.current_time == ZERO, "Changing number of staves mid-measure"
         assert len(self.stack) == 0, "Changing number of staves mid-measure"
 
         self.initial_attributes.change_staves(nstaves, True)
-        self.current_attributes = self.initial_attributes.copy()
+        self.current_attributes = self.initial_attributes
+        self._shared_attributes = True
 
         self.nstaves = nstaves
 
     def new_measure(self) -> None:
         """Start a new measure keeping the same attributes as the last."""
         if len(self.stack) > 0:
-            self.change_time(self.stack.peekitem(0)[0])
-            self.change_time(self.stack.peekitem(-1)[0])
+            self.change_time(self._stack_times[0])
+            self.change_time(self._stack_times[-1])
         self.initial_attributes = self.current_attributes
-        self.current_attributes = self.initial_attributes.copy()
+        self._shared_attributes = True
 
-        self.stack = SortedDict()
+        self.stack = {}
+        self._stack_times = []
 
-        self.current_time = Fraction(0)
-        self.time_buffer = Fraction(0)
+        self.current_time = ZERO
+        self.time_buffer = ZERO
 
     def start_attributes(self, remove_timesig: bool = True) -> AST.Attributes:
         """Return the attributes at the beginning of the measure."""
         initial = self.initial_attributes.copy()
-        if Fraction(0) in self.stack:
-            initial.merge(self.stack[Fraction(0)])
+        existing = self.stack.get(ZERO)
+        if existing is not None:
+            initial.merge(existing)
 
         # The time signature is not needed, but in case this method can be reused
         if remove_timesig:
-            for ii in initial.timesig.keys():
-                initial.timesig[ii] = None
+            initial.timesig = [None] * initial.nstaves
         return initial
 
     def get_duration(self) -> Fraction:
         """Get the duration of a measure. Raises if not available."""
         try:
-            timesig_obj = next(
-                x for x in self.attributes.timesig.values() if x is not None
-            )
+            timesig_obj = next(x for x in self.attributes.timesig if x is not None)
         except StopIteration:
             raise ValueError("No time semantics available for the current state")
         return timesig_obj.time_value
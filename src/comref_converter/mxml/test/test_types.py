@@ -0,0 +1,32 @@
+"""Test MusicXML type lookups."""
+
+import unittest
+
+from .. import types as TT
+
+
+class TestValueEnum(unittest.TestCase):
+    """Test lookups of MusicXML enumerations by value."""
+
+    def test_from_str(self) -> None:
+        """Test that from_str returns the same members as calling the enum."""
+        for enum_type in (TT.AccidentalValue, TT.BarStyle, TT.StartStop):
+            for member in enum_type:
+                with self.subTest(member=member):
+                    self.assertIs(enum_type.from_str(member.value), member)
+                    self.assertIs(
+                        enum_type.from_str(member.value), enum_type(member.value)
+                    )
+
+    def test_from_str_invalid(self) -> None:
+        """Test that unknown values raise like the enum call does."""
+        with self.assertRaises(ValueError):
+            TT.StartStop.from_str("middle")
+        with self.assertRaises(ValueError):
+            TT.StartStop.from_str(None)
+
+    def test_members_are_strings(self) -> None:
+        """Test that members compare and hash as their MusicXML value."""
+        self.assertEqual(TT.AccidentalValue.SHARP, "sharp")
+        self.assertEqual({"sharp": 1}[TT.AccidentalValue.SHARP], 1)
+        self.assertIs(TT.AccidentalValue("sharp"), TT.AccidentalValue.SHARP)
@@ -19,10 +19,46 @@ MusicXML types.
 """
 
 
+from __future__ import annotations
+
 from enum import Enum
+from typing import Type, TypeVar
+
+_E = TypeVar("_E", bound="_ValueEnum")
+
+
+class _ValueEnum(str, Enum):
+    """Enumeration of MusicXML string values.
+
+    Members are the strings themselves, so they hash and compare as plain strings
+    when used as dictionary keys.
+    """
+
+    @classmethod
+    def from_str(cls: Type[_E], value: str) -> _E:
+        """Get the member with a given MusicXML value.
+
+        Equivalent to calling the enumeration with the value, but reads the mapping of
+        values to members directly instead of going through the Enum call machinery,
+        which is noticeable when parsing every element of a score.
+
+        Parameters
+        ----------
+        value : str
+            The value of the member as written in MusicXML.
+
+        Returns
+        -------
+        _E
+            The member with the given value. Raises ValueError if there is none.
+        """
+        try:
+            return cls._value2member_map_[value]  # type: ignore[return-value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__qualname__}") from None
 
 
-class AccidentalValue(Enum):
+class AccidentalValue(_ValueEnum):
     """The accidental-value type represents notated accidentals supported by
     MusicXML.
 
@@ -85,7 +121,7 @@ class AccidentalValue(Enum):
     OTHER = "other"
 
 
-class BackwardForward(Enum):
+class BackwardForward(_ValueEnum):
     """The backward-forward type is used to specify repeat directions.
 
     The start of the repeat has a forward direction while the end of the
@@ -96,7 +132,7 @@ class BackwardForward(Enum):
     FORWARD = "forward"
 
 
-class BarStyle(Enum):
+class BarStyle(_ValueEnum):
     """The bar-style type represents barline style information.
 
     Choices are regular, dotted, dashed, heavy, light-light, light-
@@ -118,7 +154,7 @@ class BarStyle(Enum):
     NONE = "none"
 
 
-class BeamValue(Enum):
+class BeamValue(_ValueEnum):
     """
     The beam-value type represents the type of beam associated with each of 8 beam
     levels (up to 1024th notes) available for each note.
@@ -131,7 +167,7 @@ class BeamValue(Enum):
     BACKWARD_HOOK = "backward hook"
 
 
-class ClefSign(Enum):
+class ClefSign(_ValueEnum):
     """The clef-sign type represents the different clef symbols.
 
     The jianpu sign indicates that the music that follows should be in
@@ -152,7 +188,7 @@ class ClefSign(Enum):
     NONE = "none"
 
 
-class FermataShape(Enum):
+class FermataShape(_ValueEnum):
     """The fermata-shape type represents the shape of the fermata sign.
 
     The empty value is equivalent to the normal value.
@@ -169,7 +205,7 @@ class FermataShape(Enum):
     VALUE = ""
 
 
-class LineType(Enum):
+class LineType(_ValueEnum):
     """
     The line-type type distinguishes between solid, dashed, dotted, and wavy lines.
     """
@@ -180,7 +216,7 @@ class LineType(Enum):
     WAVY = "wavy"
 
 
-class NoteSizeType(Enum):
+class NoteSizeType(_ValueEnum):
     """The note-size-type type indicates the type of note being defined by a note-
     size element.
 
@@ -197,7 +233,7 @@ class NoteSizeType(Enum):
     LARGE = "large"
 
 
-class NoteTypeValue(Enum):
+class NoteTypeValue(_ValueEnum):
     """
     The note-type-value type is used for the MusicXML type element and represents
     the graphic note type, from 1024th (shortest) to maxima (longest).
@@ -219,7 +255,7 @@ class NoteTypeValue(Enum):
     MAXIMA = "maxima"
 
 
-class NoteheadValue(Enum):
+class NoteheadValue(_ValueEnum):
     """The notehead-value type indicates shapes other than the open and closed
     ovals associated with note durations.
 
@@ -272,7 +308,7 @@ class NoteheadValue(Enum):
     OTHER = "other"
 
 
-class PedalType(Enum):
+class PedalType(_ValueEnum):
     """The pedal-type simple type is used to distinguish types of pedal directions.
 
     The start value indicates the start of a damper pedal, while the
@@ -302,7 +338,7 @@ class PedalType(Enum):
     RESUME = "resume"
 
 
-class StartStopContinue(Enum):
+class StartStopContinue(_ValueEnum):
     """The start-stop-continue type is used for an attribute of musical elements
     that can either start or stop, but also need to refer to an intermediate point
     in the symbol, as for complex slurs or for formatting of symbols across system
@@ -327,7 +363,7 @@ class StartStopContinue(Enum):
     CONTINUE = "continue"
 
 
-class StartStop(Enum):
+class StartStop(_ValueEnum):
     """The start-stop type is used for an attribute of musical elements that can
     either start or stop, such as tuplets.
 
@@ -346,7 +382,7 @@ class StartStop(Enum):
     STOP = "stop"
 
 
-class StemValue(Enum):
+class StemValue(_ValueEnum):
     """
     The stem-value type represents the notated stem direction.
     """
@@ -357,7 +393,7 @@ class StemValue(Enum):
     NONE = "none"
 
 
-class Step(Enum):
+class Step(_ValueEnum):
     """
     The step type represents a step of the diatonic scale, represented using the
     English letters A through G.
@@ -372,7 +408,7 @@ class Step(Enum):
     G = "G"
 
 
-class TiedType(Enum):
+class TiedType(_ValueEnum):
     """The tied-type type is used as an attribute of the tied element to specify
     where the visual representation of a tie begins and ends.
 
@@ -398,7 +434,7 @@ class TiedType(Enum):
     LET_RING = "let-ring"
 
 
-class TimeRelation(Enum):
+class TimeRelation(_ValueEnum):
     """
     The time-relation type indicates the symbol used to represent the
     interchangeable aspect of dual time signatures.
@@ -412,7 +448,7 @@ class TimeRelation(Enum):
     HYPHEN = "hyphen"
 
 
-class TimeSymbol(Enum):
+class TimeSymbol(_ValueEnum):
     """The time-symbol type indicates how to display a time signature.
 
     The normal value is the usual fractional display, and is the implied
@@ -434,7 +470,7 @@ class TimeSymbol(Enum):
     NORMAL = "normal"
 
 
-class UpDown(Enum):
+class UpDown(_ValueEnum):
     """
     The up-down type is used for the direction of arrows and other pointed symbols
     like vertical accents, indicating which way the tip is pointing.
@@ -444,7 +480,7 @@ class UpDown(Enum):
     DOWN = "down"
 
 
-class UpDownStopContinue(Enum):
+class UpDownStopContinue(_ValueEnum):
     """
     The up-down-stop-continue type is used for octave-shift elements, indicating
     the direction of the shift from their true pitched values because of printing
@@ -457,7 +493,7 @@ class UpDownStopContinue(Enum):
     CONTINUE = "continue"
 
 
-class DynamicsType(Enum):
+class DynamicsType(_ValueEnum):
     """Dynamics can be associated either with a note or a general musical
     direction.
 
@@ -508,7 +544,7 @@ class DynamicsType(Enum):
     OTHER_DYNAMICS = "other-dynamics"
 
 
-class WedgeType(Enum):
+class WedgeType(_ValueEnum):
     """The wedge type is crescendo for the start of a wedge that is closed at the
     left side, diminuendo for the start of a wedge that is closed on the right
     side, and stop for the end of a wedge.
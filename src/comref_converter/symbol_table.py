@@ -19,45 +19,74 @@ Implements a symbol table that allows objects to have unique identifiers.
 """
 
 
+from collections import defaultdict
 from fractions import Fraction
-from typing import Dict, List, Optional, Tuple
+from itertools import count, islice
+from typing import DefaultDict, Dict, Iterator, List, Optional, Tuple
 
 from .mtn import semantics as MS
 from .mtn.types import TokenType
 
 Identifier = int
 
-GROUP_TOKENS = {
-    TokenType.ARPEGGIATE,
-    TokenType.BEAM,
-    TokenType.GLISSANDO,
-    TokenType.SLIDE,
-    TokenType.SLUR,
-    TokenType.TIED,
-    TokenType.WAVY_LINE,
-}
+# Bits reserved for the deambiguation number in packed keys
+_NUMBER_BITS = 32
+
+GROUP_TOKENS = frozenset(
+    {
+        TokenType.ARPEGGIATE,
+        TokenType.BEAM,
+        TokenType.GLISSANDO,
+        TokenType.SLIDE,
+        TokenType.SLUR,
+        TokenType.TIED,
+        TokenType.WAVY_LINE,
+    }
+)
+
+
+def _pack_key(value: int, number: Optional[int]) -> int:
+    """Pack an integer and an optional non-negative number into a single int key.
+
+    Small ints hash to themselves, so lookups with packed keys neither build a tuple
+    nor call any Python-level hash.
+    """
+    return (value << _NUMBER_BITS) | (0 if number is None else number + 1)
 
 
 class SymbolTable:
     """A table keeping track of opened and closed symbols and identifiers."""
 
+    __slots__ = (
+        "beam_stacks",
+        "arpeggios",
+        "point_to_point",
+        "ties",
+        "_identifiers",
+    )
+
     def __init__(self) -> None:
         """Construct an empty SymbolTable."""
-        # There has to be a beam stack for each combination of note types.
-        self.beam_stacks: Dict[Tuple[bool, bool], List[int]] = {
-            (cue, grace): [] for cue in [False, True] for grace in [False, True]
-        }
+        # There has to be a beam stack for each combination of note types, indexed by
+        # (cue << 1) | grace.
+        self.beam_stacks: List[List[int]] = [[] for _ in range(4)]
 
         # For arpeggios. The relevant thing is that all arpeggios on the same chord
         # are the same object (thus, same time delta). Otherwise, consider the number.
-        self.arpeggios: Dict[Tuple[Fraction, Optional[int]], Identifier] = {}
+        # Keyed on the numerator and denominator of the delta, since hashing a Fraction
+        # is far slower than hashing two ints.
+        self.arpeggios: Dict[Tuple[int, int, Optional[int]], Identifier] = {}
 
-        # For slurs, slides, glissandos and wavy lines.
-        self.point_to_point: Dict[Tuple[TokenType, Optional[int]], Identifier] = {}
+        # For slurs, slides, glissandos, wavy lines, tuplets and wedges. There is one
+        # table per token type, keyed only by the number.
+        self.point_to_point: DefaultDict[TokenType, Dict[Optional[int], Identifier]] = (
+            defaultdict(dict)
+        )
 
-        # For ties the position is needed and optionally their number
-        self.ties: Dict[Tuple[MS.StaffPosition, Optional[int]], Identifier] = {}
-        self._next_id: Identifier = 1
+        # For ties the position is needed and optionally their number, packed together
+        # with _pack_key.
+        self.ties: Dict[int, Identifier] = {}
+        self._identifiers: Iterator[Identifier] = count(1)
 
     def new_measure(self) -> None:
         """Set everything clean for a new measure."""
@@ -65,13 +94,11 @@ class SymbolTable:
 
     def reset(self) -> None:
         """Set the symbol table back to the default state."""
-        self.beam_stacks = {
-            (cue, grace): [] for cue in {False, True} for grace in {False, True}
-        }
+        self.beam_stacks = [[] for _ in range(4)]
         self.arpeggios = {}
-        self.point_to_point = {}
+        self.point_to_point = defaultdict(dict)
         self.ties = {}
-        self._next_id = 1
+        self._identifiers = count(1)
 
     def identify_beams(
         self,
@@ -98,14 +125,12 @@ class SymbolTable:
         List[Identifier]
             A list of identifiers to give to each beam.
         """
-        beams = self.beam_stacks[(cue, grace)]
+        beams = self.beam_stacks[(cue << 1) | grace]
 
         if len(beams) < nbeams:
-            for _ in range(nbeams - len(beams)):
-                beams.append(self.give_identifier())
+            beams.extend(islice(self._identifiers, nbeams - len(beams)))
         elif len(beams) > nbeams:
-            for _ in range(len(beams) - nbeams):
-                beams.pop()
+            del beams[nbeams:]
 
         return beams
 
@@ -128,12 +153,11 @@ class SymbolTable:
         Identifier
             A unique identifier for the arpeggio object.
         """
-        try:
-            return self.arpeggios[(delta, number)]
-        except KeyError:
-            ident = self.give_identifier()
-            self.arpeggios[(delta, number)] = ident
-            return ident
+        key = (delta.numerator, delta.denominator, number)
+        ident = self.arpeggios.get(key)
+        if ident is None:
+            ident = self.arpeggios[key] = self.give_identifier()
+        return ident
 
     def identify_point_to_point(
         self,
@@ -154,12 +178,11 @@ class SymbolTable:
         Identifier
             A unique identifier for the object.
         """
-        try:
-            return self.point_to_point.pop((tok, number))
-        except KeyError:
-            ident = self.give_identifier()
-            self.point_to_point[(tok, number)] = ident
-            return ident
+        table = self.point_to_point[tok]
+        ident = table.pop(number, None)
+        if ident is None:
+            ident = table[number] = self.give_identifier()
+        return ident
 
     def identify_tie(
         self,
@@ -180,16 +203,12 @@ class SymbolTable:
         Identifier
             A unique identifier for the object.
         """
-        try:
-            return self.ties.pop((pitch, number))
-        except KeyError:
-            ident = self.give_identifier()
-            self.ties[(pitch, number)] = ident
-            return ident
+        key = _pack_key(int(pitch), number)
+        ident = self.ties.pop(key, None)
+        if ident is None:
+            ident = self.ties[key] = self.give_identifier()
+        return ident
 
     def give_identifier(self) -> Identifier:
         """Provide an identifier to a symbol without registering it to the table."""
-        identifier = self._next_id
-        self._next_id += 1
-
-        return identifier
+        return next(self._identifiers)
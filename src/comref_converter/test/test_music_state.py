@@ -1,6 +1,18 @@
 import unittest
+from fractions import Fraction
+
+from .. import music_state as MST
 
 
 class TestMusicState(unittest.TestCase):
     def test_forward(self) -> None:
         ...
+
+    def test_shared_zero(self) -> None:
+        """Test that new measures start at the zero shared with the translators."""
+        state = MST.ScoreState()
+        state.change_time(Fraction(3, 2))
+        state.new_measure()
+
+        self.assertIs(state.current_time, MST.ZERO)
+        self.assertIs(state.time_buffer, MST.ZERO)
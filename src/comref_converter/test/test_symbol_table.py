@@ -0,0 +1,61 @@
+"""Test the identifiers given by the symbol table."""
+
+import unittest
+from fractions import Fraction
+
+from ..mtn import semantics as MS
+from ..mtn.types import TokenType
+from ..symbol_table import SymbolTable
+
+
+class TestSymbolTable(unittest.TestCase):
+    """Test that open symbols are matched with their closing counterparts."""
+
+    def test_identify_tie(self) -> None:
+        """Test that ties are matched by position and number."""
+        table = SymbolTable()
+        first = table.identify_tie(MS.StaffPosition(1, 4), None)
+        other = table.identify_tie(MS.StaffPosition(1, 4), 1)
+        below = table.identify_tie(MS.StaffPosition(1, -4), None)
+        self.assertEqual(len({first, other, below}), 3)
+
+        self.assertEqual(table.identify_tie(MS.StaffPosition(1, 4), None), first)
+        self.assertEqual(table.identify_tie(MS.StaffPosition(1, 4), 1), other)
+        self.assertEqual(table.identify_tie(MS.StaffPosition(1, -4), None), below)
+
+        # Closed ties are forgotten
+        self.assertNotIn(
+            table.identify_tie(MS.StaffPosition(1, 4), None), {first, other, below}
+        )
+
+    def test_identify_arpeggios(self) -> None:
+        """Test that arpeggios on the same time and number share an identifier."""
+        table = SymbolTable()
+        first = table.identify_arpeggios(Fraction(1, 2), None)
+        self.assertEqual(table.identify_arpeggios(Fraction(2, 4), None), first)
+        self.assertNotEqual(table.identify_arpeggios(Fraction(1, 2), 1), first)
+        self.assertNotEqual(table.identify_arpeggios(Fraction(1, 3), None), first)
+
+    def test_identify_point_to_point(self) -> None:
+        """Test that spanners are matched per token type and number."""
+        table = SymbolTable()
+        slur = table.identify_point_to_point(TokenType.SLUR, 1)
+        wedge = table.identify_point_to_point(TokenType.WEDGE, 1)
+        self.assertNotEqual(slur, wedge)
+
+        self.assertEqual(table.identify_point_to_point(TokenType.SLUR, 1), slur)
+        self.assertEqual(table.identify_point_to_point(TokenType.WEDGE, 1), wedge)
+
+        table.reset()
+        self.assertEqual(table.identify_point_to_point(TokenType.SLUR, 1), 1)
+
+    def test_identify_beams(self) -> None:
+        """Test that each combination of cue and grace notes has its own beams."""
+        table = SymbolTable()
+        regular = list(table.identify_beams(False, False, 2))
+        grace = list(table.identify_beams(False, True, 1))
+        self.assertEqual(len(set(regular + grace)), 3)
+
+        self.assertEqual(table.identify_beams(False, False, 1), regular[:1])
+        self.assertEqual(table.identify_beams(False, True, 1), grace)
+        self.assertEqual(table.identify_beams(True, False, 0), [])
@@ -21,7 +21,8 @@ Conversor from MusicXML to MTN.
 from copy import deepcopy
 from decimal import Decimal
 from fractions import Fraction
-from typing import Any, Dict, List, Optional, Set, Tuple, TypeVar, Union, cast
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Set, Tuple, TypeVar, Union, cast
 from xml.etree import ElementTree as ET
 
 from . import mtn as MTN
@@ -275,6 +276,62 @@ class TranslatorMXML(Translator):
                 self.symbol_table.reset()
         return output
 
+    def translate_file(
+        self,
+        source: Union[str, Path, IO[bytes]],
+        score_id: str,
+        engr_first_line: Set[MeasureID],
+    ) -> MTN.AST.Score:
+        """Translate a MusicXML score-partwise document while it is being parsed.
+
+        Unlike translate, the whole document tree is never built: each measure is
+        translated as soon as its closing tag is read and discarded afterwards, so
+        memory use stays bounded by the size of a single measure of the input.
+
+        Parameters
+        ----------
+        source : Union[str, Path, IO[bytes]]
+            Path or binary file object of an uncompressed MusicXML document.
+        score_id : str
+            Identifier given to the resulting score.
+        engr_first_line : Set[MeasureID]
+            Set of measure identifiers for those systems that lie at the beginning of a
+            line (and thus need a refresh of clef and key elements).
+
+        Returns
+        -------
+        MTN.AST.Score
+            Representation of the score in MTN.
+        """
+        output = MTN.AST.Score([], score_id=score_id)
+        part_dict: Dict[MeasureID, MTN.AST.Measure] = {}
+        part: Optional[ET.Element] = None
+        depth = 0
+
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 2 and elem.tag == "part":
+                    part = elem
+                    part_dict = {}
+                continue
+
+            depth -= 1
+            if part is None:
+                continue
+            if depth == 2 and elem.tag == "measure":
+                self._visit_part_measure(
+                    part.get("id", None), elem, engr_first_line, part_dict
+                )
+                part.remove(elem)
+            elif elem is part:
+                self._end_part()
+                output.measures.extend(part_dict.values())
+                self.symbol_table.reset()
+                part.clear()
+                part = None
+        return output
+
     def reset(self) -> None:
         """Reset object to its default state."""
         self.state = MST.ScoreState()
@@ -334,28 +391,57 @@ class TranslatorMXML(Translator):
         part_id = part_element.get("id", None)
         output_dict: Dict[MeasureID, MTN.AST.Measure] = {}
         for measure in part_element:
-            measure_id = measure.get("number", None)
-            # print(f"measure id: {measure_id} !!!!!!!!!!!!!!!!!!!!!!!!")
+            self._visit_part_measure(part_id, measure, engr_first_line, output_dict)
+        self._end_part()
 
-            assert isinstance(part_id, str) and isinstance(
-                measure_id, str
-            ), "PartID or MeasureID could not be found"
-            identifier: MeasureID = (part_id, measure_id)
+        return output_dict
 
-            measure_mtn = self._visit_measure(measure)
+    def _visit_part_measure(
+        self,
+        part_id: Optional[str],
+        measure: ET.Element,
+        engr_first_line: Set[MeasureID],
+        output_dict: Dict[MeasureID, MTN.AST.Measure],
+    ) -> None:
+        """Visit a single measure element of a part and store it in MTN.
 
-            if identifier in engr_first_line:
-                self._add_start_measure_elements(measure_mtn)
-            measure_mtn = self._postprocess_measure(measure_mtn)
+        Parameters
+        ----------
+        part_id : Optional[str]
+            Identifier of the part the measure belongs to.
+        measure : ET.Element
+            The measure element to visit.
+        engr_first_line : Set[MeasureID]
+            Set of measure identifiers for those systems that lie at the beginning of a
+            line (and thus need a refresh of clef and key elements).
+        output_dict : Dict[MeasureID, MTN.AST.Measure]
+            Dictionary of the measures of the part converted so far, where the new
+            measure is stored.
+        """
+        measure_id = measure.get("number", None)
+        # print(f"measure id: {measure_id} !!!!!!!!!!!!!!!!!!!!!!!!")
+
+        assert isinstance(part_id, str) and isinstance(
+            measure_id, str
+        ), "PartID or MeasureID could not be found"
+        identifier: MeasureID = (part_id, measure_id)
 
-            output_dict[identifier] = measure_mtn
-            measure_mtn.measure_id = measure_id
-            measure_mtn.part_id = part_id
+        measure_mtn = self._visit_measure(measure)
 
-            self.last_measure = measure_mtn
+        if identifier in engr_first_line:
+            self._add_start_measure_elements(measure_mtn)
+        measure_mtn = self._postprocess_measure(measure_mtn)
 
-            self._new_measure()
+        output_dict[identifier] = measure_mtn
+        measure_mtn.measure_id = measure_id
+        measure_mtn.part_id = part_id
 
+        self.last_measure = measure_mtn
+
+        self._new_measure()
+
+    def _end_part(self) -> None:
+        """Close the last measure of a part and prepare the state for the next one."""
         # Check the last measure has a right barline
         if self.last_measure is not None and self.last_measure.right_barline is None:
             self.last_measure.right_barline = MTN.AST.Barline(
@@ -373,8 +459,6 @@ class TranslatorMXML(Translator):
             self.last_measure.right_barline
         self._new_part()
 
-        return output_dict
-
     def _postprocess_measure(self, measure: MTN.AST.Measure) -> MTN.AST.Measure:
         """Ensure compliance to MTN spec."""
         new_children: List[MTN.AST.TopLevel] = []
@@ -413,7 +497,7 @@ class TranslatorMXML(Translator):
                     self.last_measure.right_barline.delta = self.last_measure.duration
             elif self.last_measure.right_barline is not None:
                 measure.left_barline = deepcopy(self.last_measure.right_barline)
-                measure.left_barline.delta = Fraction(0)
+                measure.left_barline.delta = MST.ZERO
             else:
                 # Default barline
                 default_barline = MTN.AST.Barline(
@@ -430,7 +514,7 @@ class TranslatorMXML(Translator):
                 )
                 self.last_measure.right_barline = default_barline
                 measure.left_barline = deepcopy(default_barline)
-                measure.left_barline.delta = Fraction(0)
+                measure.left_barline.delta = MST.ZERO
 
         measure.elements = new_children
         measure.sort()
@@ -450,7 +534,7 @@ class TranslatorMXML(Translator):
         first_liner = self.state.start_attributes()
         first_liner = self._duplicate_subtree(first_liner)
 
-        for staff, key in first_liner.key.items():
+        for staff, key in enumerate(first_liner.key, start=1):
             if key is None or staff > self.state.nstaves:
                 continue
             if key.fifths is not None:
@@ -527,8 +611,8 @@ class TranslatorMXML(Translator):
                 if barline.delta == 0:
                     left_barline = barline
                 elif (
-                    self.state.attributes.timesig[1] is not None
-                    and barline.delta == self.state.attributes.timesig[1].time_value
+                    self.state.attributes.timesig[0] is not None
+                    and barline.delta == self.state.attributes.timesig[0].time_value
                 ):
                     right_barline = barline
                 else:
@@ -559,7 +643,7 @@ class TranslatorMXML(Translator):
             elif child.tag == "attributes":
                 attribute_nodes.append(self._visit_attributes(child))
 
-        self.state.change_time(Fraction(0))
+        self.state.change_time(MST.ZERO)
 
         return self.state.attribute_list
         # return attribute_nodes
@@ -622,7 +706,7 @@ class TranslatorMXML(Translator):
         accidentals: List[MTN.AST.Token] = []
         beam_elements: List[ET.Element] = []
         dots: List[MTN.AST.Token] = []
-        duration: Fraction = Fraction(0)
+        duration: Fraction = MST.ZERO
         implicit_ntype: Optional[MTN.TT.NoteType] = None
         notations: List[MTN.AST.Token | MTN.AST.Tuplet] = []
         notations_elements: List[ET.Element] = []
@@ -745,9 +829,9 @@ class TranslatorMXML(Translator):
         if notehead is not None:
             notehead.position = position
             if cue:
-                notehead.modifiers["cue"] = True
+                notehead.set_modifier("cue", True)
             if grace:
-                notehead.modifiers["grace"] = True
+                notehead.set_modifier("grace", True)
         else:
             notehead = self._infer_notehead(ntype, position, grace, cue)
 
@@ -793,14 +877,14 @@ class TranslatorMXML(Translator):
             # print("# # # # # " * 5)
             # print(beam_processed)
             self._create_notegroups(grace, beam_processed)
-            # print({x: len(v) for x, v in self.group_stack.stack.items()})
+            # print({x: self.group_stack.length(x) for x in (False, True)})
             base_group = self.group_stack.bottom(grace)
             current_group = self.group_stack.top(grace)
             if current_group is None:
                 raise ValueError("Malformed beam structure: A Group should be open")
             current_group.children.append(current_chord)
             self._remove_notegroups(grace, beam_processed)
-            # print({x: len(v) for x, v in self.group_stack.stack.items()})
+            # print({x: self.group_stack.length(x) for x in (False, True)})
 
             if return_at_end:
                 return base_group
@@ -858,7 +942,7 @@ class TranslatorMXML(Translator):
         """Create logic representation of a beam element to ease processing."""
         beam_processed: List[Tuple[MXML.TT.BeamValue, Optional[int]]] = [
             (
-                MXML.TT.BeamValue(beam.text),
+                MXML.TT.BeamValue.from_str(beam.text),
                 _maybe_int(beam.get("number")),
             )
             for beam in beams
@@ -1012,7 +1096,7 @@ class TranslatorMXML(Translator):
         ntype = None
         mtn_ntype = None
         if type_elm is not None and type_elm.text is not None:
-            ntype = MXML.TT.NoteTypeValue(type_elm.text)
+            ntype = MXML.TT.NoteTypeValue.from_str(type_elm.text)
             mtn_ntype = NTYPE_MXML2MTN[ntype]
 
         return (Fraction(actual, normal), mtn_ntype)
@@ -1082,7 +1166,7 @@ class TranslatorMXML(Translator):
         tuplet_type = tuplet.get("type")
         if tuplet_type is None:
             raise ValueError("A tied element has no compulsory attribute 'type'.")
-        tuplet_value = STARTSTOP_MXML2MTN[MXML.TT.StartStop(tuplet_type)]
+        tuplet_value = STARTSTOP_MXML2MTN[MXML.TT.StartStop.from_str(tuplet_type)]
         show_number = not tuplet.get("show-number", "none") == "none"
         show_bracket = not tuplet.get("bracket", "no") == "no"
 
@@ -1129,7 +1213,7 @@ class TranslatorMXML(Translator):
         tied_type = tied.get("type")
         if tied_type is None:
             raise ValueError("A tied element has no compulsory attribute 'type'.")
-        position = MXML.TT.TiedType(tied_type)
+        position = MXML.TT.TiedType.from_str(tied_type)
 
         if position in {MXML.TT.TiedType.CONTINUE, MXML.TT.TiedType.LET_RING}:
             return None
@@ -1154,7 +1238,7 @@ class TranslatorMXML(Translator):
 
         # Grab any other value that is not really interesting
         try:
-            position = MXML.TT.StartStop(ptp_type)
+            position = MXML.TT.StartStop.from_str(ptp_type)
         except ValueError:
             return None
 
@@ -1239,7 +1323,7 @@ class TranslatorMXML(Translator):
             Equivalent MTN element. If the stem is not to be shown, returns None.
         """
         assert stem.text is not None, "Empty stem contents"
-        stem_type = MXML.TT.StemValue(stem.text)
+        stem_type = MXML.TT.StemValue.from_str(stem.text)
         if stem_type == MXML.TT.StemValue.NONE:
             return None
         elif stem_type == MXML.TT.StemValue.DOUBLE:
@@ -1268,7 +1352,7 @@ class TranslatorMXML(Translator):
             Whether or not the element should be visible.
         """
         assert notehead.text is not None, "Empty notehead contents"
-        nh_type = MXML.TT.NoteheadValue(notehead.text)
+        nh_type = MXML.TT.NoteheadValue.from_str(notehead.text)
 
         if nh_type == MXML.TT.NoteheadValue.NORMAL:
             return None, True
@@ -1318,7 +1402,7 @@ class TranslatorMXML(Translator):
         alter = (
             Fraction.from_float(float(alter_elm.text))
             if alter_elm is not None and alter_elm.text is not None
-            else Fraction(0)
+            else MST.ZERO
         )
         return MTN.MS.NotePitch(step, octave, alter)
 
@@ -1347,7 +1431,7 @@ class TranslatorMXML(Translator):
         step = MTN.TT.NamedPitch[step_elm.text]
         octave = int(octave_elm.text)
 
-        return MTN.MS.NotePitch(step, octave, Fraction(0))
+        return MTN.MS.NotePitch(step, octave, MST.ZERO)
 
     def _visit_duration(
         self,
@@ -1374,7 +1458,7 @@ class TranslatorMXML(Translator):
     ) -> MTN.TT.NoteType:
         """Visit a (note) type element in the MXML tree."""
         assert ntype.text is not None, "Invalid data within note type element"
-        tobj = MXML.TT.NoteTypeValue(ntype.text)
+        tobj = MXML.TT.NoteTypeValue.from_str(ntype.text)
 
         return NTYPE_MXML2MTN[tobj]
 
@@ -1394,7 +1478,7 @@ class TranslatorMXML(Translator):
         accidental: ET.Element,
     ) -> List[MTN.AST.Token]:
         """Visit an accidental element in the MXML tree and convert it to MTN."""
-        accidental_type = MXML.TT.AccidentalValue(accidental.text)
+        accidental_type = MXML.TT.AccidentalValue.from_str(accidental.text)
         compounds: List[MXML.TT.AccidentalValue]
 
         if accidental_type in ACCIDENTAL_MXML2MTN.keys():
@@ -1510,7 +1594,7 @@ class TranslatorMXML(Translator):
 
         output = []
         for child in dynamics:
-            dyn_type = MXML.TT.DynamicsType(child.tag)
+            dyn_type = MXML.TT.DynamicsType.from_str(child.tag)
             if dyn_type not in {MXML.TT.DynamicsType.OTHER_DYNAMICS}:
                 output.append(
                     MTN.AST.Token(
@@ -1539,7 +1623,7 @@ class TranslatorMXML(Translator):
             The token representing the starting or ending of the wedge. If it is a
             continuation wedge, it returns None.
         """
-        wedge_type = MXML.TT.WedgeType(wedge.get("type"))
+        wedge_type = MXML.TT.WedgeType.from_str(wedge.get("type"))
 
         if wedge_type == MXML.TT.WedgeType.CONTINUE:
             return None
@@ -1623,7 +1707,7 @@ class TranslatorMXML(Translator):
                         tok.position = MTN.MS.StaffPosition(None, None)
                     output_attributes.set_timesig(new_timesig, new_staff)
             else:
-                output_attributes.timesig[staff] = timesig
+                output_attributes.set_timesig(timesig, staff)
 
         # Merge once to account for the new clef and time, since these are needed for
         # the correct position of key accidentals (could merge a dict and pass it as
@@ -1632,7 +1716,9 @@ class TranslatorMXML(Translator):
 
         for key_elm in key_elements:
             key_processed = self._visit_key(key_elm)
-            output_attributes.key |= key_processed
+            for staff, key in key_processed.items():
+                if staff <= self.state.nstaves:
+                    output_attributes.set_key(key, staff)
 
         self.state.attributes = output_attributes
 
@@ -1753,7 +1839,7 @@ class TranslatorMXML(Translator):
             List of tokens present in the key at the given staff.
         """
         output: List[MTN.AST.Token] = []
-        clef = self.state.attributes.clef[staff]
+        clef = self.state.attributes.get_clef(staff)
         assert clef is not None, (
             "Key cannot be processed because there is no key configuration for the "
             "current staff."
@@ -1810,7 +1896,7 @@ class TranslatorMXML(Translator):
                 )
             elif child.tag == "key-accidental":
                 if child.text is not None:
-                    mxml_alter = MXML.TT.AccidentalValue(child.text)
+                    mxml_alter = MXML.TT.AccidentalValue.from_str(child.text)
                     alter_symbols[-1] = ACCIDENTAL_MXML2MTN[mxml_alter]
 
         alters: List[Optional[MTN.TT.AccidentalType]] = [
@@ -1839,16 +1925,14 @@ class TranslatorMXML(Translator):
         alters: List[MTN.TT.AccidentalType],
         staff: int,
     ) -> List[MTN.AST.Token]:
-        clef = self.state.attributes.clef[staff]
+        clef = self.state.attributes.get_clef(staff)
         assert clef is not None, (
             "Key cannot be processed because there is no key configuration for "
             "the current staff."
         )
         output: List[MTN.AST.Token] = []
         for step, symbol in zip(steps, alters):
-            position = clef.pitch2pos(
-                MTN.MS.NotePitch(step, clef.octave + 1, Fraction(0))
-            )
+            position = clef.pitch2pos(MTN.MS.NotePitch(step, clef.octave + 1, MST.ZERO))
             position = MTN.MS.MusicalKey.ensure_range(position)
             output.append(
                 MTN.AST.Token(
@@ -1882,7 +1966,7 @@ class TranslatorMXML(Translator):
             sign_element is not None and sign_element.text is not None
         ), "Invalid clef symbol without a sign"
 
-        sign = MXML.TT.ClefSign(sign_element.text)
+        sign = MXML.TT.ClefSign.from_str(sign_element.text)
         clef_type = CLEF_MXML2MTN[sign]
 
         if sign in {MXML.TT.ClefSign.PERCUSSION, MXML.TT.ClefSign.NONE}:
@@ -1948,7 +2032,7 @@ class TranslatorMXML(Translator):
             Staff where this element should be placed. Positive integer for a specific
             placement or self._ALL_STAVES if it applies to all staves.
         """
-        time_type = MXML.TT.TimeSymbol(time.get("symbol", "normal"))
+        time_type = MXML.TT.TimeSymbol.from_str(time.get("symbol", "normal"))
         staff_val: Optional[str] = time.get("number", None)
         if staff_val is None:
             staff = self._ALL_STAVES
@@ -2050,7 +2134,7 @@ class TranslatorMXML(Translator):
             The value for the time signature and the parse tree for the set of time
             signatures.
         """
-        total = Fraction(0, 1)
+        total = MST.ZERO
         output: List[Union[MTN.AST.TimesigFraction, MTN.AST.Token]] = []
         for ii, (num, den) in enumerate(zip(numerators, denominators)):
             if ii != 0:
@@ -2124,7 +2208,7 @@ class TranslatorMXML(Translator):
 
         for child in barline:
             if child.tag == "bar-style":
-                barline_type = MXML.TT.BarStyle(child.text)
+                barline_type = MXML.TT.BarStyle.from_str(child.text)
                 if barline_type == MXML.TT.BarStyle.NONE:
                     return None
             elif child.tag == "segno":
@@ -2146,12 +2230,12 @@ class TranslatorMXML(Translator):
 
         # Handling timing information of the barline
         if barline.get("location") == "left":
-            barline_time = Fraction(0)
+            barline_time = MST.ZERO
         elif (
             barline.get("location") == "right"
-            and self.state.attributes.timesig[1] is not None
+            and self.state.attributes.timesig[0] is not None
         ):
-            barline_time = self.state.attributes.timesig[1].time_value
+            barline_time = self.state.attributes.timesig[0].time_value
         else:
             barline_time = self.state.current_time
 
@@ -2204,7 +2288,7 @@ class TranslatorMXML(Translator):
 
     def _visit_repeat(self, repeat: ET.Element) -> MTN.AST.Token:
         """Generate a repeat token from a MXML element."""
-        direction = MXML.TT.BackwardForward(repeat.get("direction", "forward"))
+        direction = MXML.TT.BackwardForward.from_str(repeat.get("direction", "forward"))
         return MTN.AST.Token(
             MTN.TT.TokenType.REPEAT,
             {"type": BWFW_MXML2MTN[direction]},
@@ -57,6 +57,16 @@ CLASS_TYPE: Dict[TT.TokenType, Type] = {
     TT.TokenType.WEDGE: TT.WedgeType,
 }
 
+# Enumeration members by their value as written in MTN files. Looking them up in a dict
+# is cheaper than calling the Enum class for every token of a score.
+TOKEN_TYPES: Dict[str, TT.TokenType] = {tok.value: tok for tok in TT.TokenType}
+
+MODIFIER_TYPES: Dict[TT.TokenType, Dict[str, Any]] = {
+    tok: {member.value: member for member in cls}
+    for tok, cls in CLASS_TYPE.items()
+    if cls is not TT.Digits
+}
+
 
 class TranslatorXML(Translator):
     """Translator from MTN XML to MTN."""
@@ -91,7 +101,11 @@ class TranslatorXML(Translator):
 
     def _visit_score(self, score: ET.Element) -> AST.Score:
         """Visit score node."""
-        children = [self._visit_measure(measure) for measure in score]
+        # Comments are only skipped here and within measures, where children are
+        # visited by position rather than by tag.
+        children = [
+            self._visit_measure(measure) for measure in score if _is_element(measure)
+        ]
         score_id = score.get("id", "<NULL>")
 
         return AST.Score(children, score_id)
@@ -109,7 +123,8 @@ class TranslatorXML(Translator):
         self.current_staves = staves
 
         elements: List[AST.TopLevel] = []
-        for ii, child in enumerate(measure):
+        measure_children = [child for child in measure if _is_element(child)]
+        for ii, child in enumerate(measure_children):
             if child.tag == "rest":
                 elements.append(self._visit_rest(child))
             elif child.tag == "note_group":
@@ -118,7 +133,7 @@ class TranslatorXML(Translator):
                 barline = self._visit_barline(child)
                 if ii == 0:
                     left_barline = barline
-                elif ii == len(measure) - 1:
+                elif ii == len(measure_children) - 1:
                     right_barline = barline
                 else:
                     elements.append(barline)
@@ -141,15 +156,9 @@ class TranslatorXML(Translator):
 
     def _visit_attributes(self, attributes: ET.Element) -> AST.Attributes:
         delta = self._get_delta(attributes)
-        key: Dict[int, AST.Key | None] = {
-            ii: None for ii in range(1, self.current_staves + 1)
-        }
-        clef: Dict[int, AST.Clef | None] = {
-            ii: None for ii in range(1, self.current_staves + 1)
-        }
-        timesig: Dict[int, AST.TimeSignature | None] = {
-            ii: None for ii in range(1, self.current_staves + 1)
-        }
+        key: List[AST.Key | None] = [None] * self.current_staves
+        clef: List[AST.Clef | None] = [None] * self.current_staves
+        timesig: List[AST.TimeSignature | None] = [None] * self.current_staves
 
         for child in attributes:
             staff = maybe(child.get("staff"), int)
@@ -158,13 +167,13 @@ class TranslatorXML(Translator):
 
             if child.tag == "key":
                 key_node = self._visit_key(child)
-                key[staff] = key_node
+                key[staff - 1] = key_node
             elif child.tag == "clef":
                 clef_node = self._visit_clef(child)
-                clef[staff] = clef_node
+                clef[staff - 1] = clef_node
             elif child.tag == "time_signature":
                 ts_node = self._visit_time_signature(child)
-                timesig[staff] = ts_node
+                timesig[staff - 1] = ts_node
             else:
                 raise ValueError("Invalid child in attributes node")
 
@@ -273,9 +282,7 @@ class TranslatorXML(Translator):
         # handled at some point in the future, but is not a priority now.
         accidentals: List[AST.Token] = []
         naturals: List[AST.Token] = []
-        alterations: List[Optional[TT.AccidentalType]] = [
-            None for _ in range(len(TT.NamedPitch))
-        ]
+        alterations: List[Optional[TT.AccidentalType]] = [None] * MS.PITCHES_PER_OCTAVE
         fifths: Optional[int] = self._get_fifths(key)
         staff = self._get_staff(key)
 
@@ -404,7 +411,9 @@ class TranslatorXML(Translator):
         return AST.Tuplet(AST.Number(digits) if len(digits) > 0 else None, tuplet_tok)
 
     def _visit_token(self, token: ET.Element) -> AST.Token:
-        token_type = TT.TokenType(token.tag)
+        token_type = TOKEN_TYPES.get(token.tag)
+        if token_type is None:
+            raise ValueError(f"{token.tag!r} is not a valid TokenType")
         modifiers: Dict[str, Any] = {}
 
         staff = maybe(token.get("staff", None), int)
@@ -414,14 +423,18 @@ class TranslatorXML(Translator):
         if ident is None:
             raise ValueError("Token has no identifier")
 
-        if token_type in CLASS_TYPE and CLASS_TYPE[token_type] == TT.Digits:
-            mod = TT.Digits(maybe(token.get("type"), int))
+        modifier_type = token.get("type")
+        modifier_values = MODIFIER_TYPES.get(token_type)
+        if token_type == TT.TokenType.NUMBER:
+            mod = TT.Digits(maybe(modifier_type, int))
+        elif modifier_values is None or modifier_type is None:
+            mod = None
         else:
-            try:
-                # FIXME: This potentially allows the string to escape without conversion
-                mod = maybe(token.get("type"), CLASS_TYPE[token_type])
-            except KeyError:
-                mod = None
+            mod = modifier_values.get(modifier_type)
+            if mod is None:
+                raise ValueError(
+                    f"{modifier_type!r} is not a valid {CLASS_TYPE[token_type].__name__}"
+                )
 
         if mod is not None:
             modifiers["type"] = mod
@@ -478,3 +491,11 @@ def maybe(obj: T1 | None, func: Callable[[T1], T2]) -> T2 | None:
     if obj is not None:
         return func(obj)
     return None
+
+
+def _is_element(node: ET.Element) -> bool:
+    """Tell apart elements from comments or processing instructions.
+
+    Other tree builders, such as lxml's, keep those in the tree with a non-string tag.
+    """
+    return isinstance(node.tag, str)
@@ -79,14 +79,10 @@ class VisitorCountNodes(AST.Visitor):
 
     def visit_attributes(self, attributes: AST.Attributes) -> int:
         """Perform visiting operation on Attributes node."""
-        subnodes_key = sum(
-            x.accept(self) for x in attributes.key.values() if x is not None
-        )
-        subnodes_clef = sum(
-            x.accept(self) for x in attributes.clef.values() if x is not None
-        )
+        subnodes_key = sum(x.accept(self) for x in attributes.key if x is not None)
+        subnodes_clef = sum(x.accept(self) for x in attributes.clef if x is not None)
         subnodes_timesig = sum(
-            x.accept(self) for x in attributes.timesig.values() if x is not None
+            x.accept(self) for x in attributes.timesig if x is not None
         )
         return 1 + subnodes_clef + subnodes_key + subnodes_timesig
 
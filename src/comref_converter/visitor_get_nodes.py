@@ -113,15 +113,15 @@ class VisitorGetNodes(AST.Visitor):
         """Perform visiting operation on Attributes node."""
         output: List[AST.SyntaxNode] = [attributes]
 
-        for key in attributes.key.values():
+        for key in attributes.key:
             if key is not None:
                 output.extend(key.accept(self))
 
-        for clef in attributes.clef.values():
+        for clef in attributes.clef:
             if clef is not None:
                 output.extend(clef.accept(self))
 
-        for timesig in attributes.timesig.values():
+        for timesig in attributes.timesig:
             if timesig is not None:
                 output.extend(timesig.accept(self))
 
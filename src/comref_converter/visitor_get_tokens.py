@@ -109,15 +109,15 @@ class VisitorGetTokens(AST.Visitor):
         """Perform visiting operation on Attributes node."""
         output = []
 
-        for key in attributes.key.values():
+        for key in attributes.key:
             if key is not None:
                 output += key.accept(self)
 
-        for clef in attributes.clef.values():
+        for clef in attributes.clef:
             if clef is not None:
                 output += clef.accept(self)
 
-        for timesig in attributes.timesig.values():
+        for timesig in attributes.timesig:
             if timesig is not None:
                 output += timesig.accept(self)
 
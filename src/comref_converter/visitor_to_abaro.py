@@ -338,9 +338,9 @@ class VisitorToABaro(AST.Visitor):
         ):
             raise ABaroExportError("ABaro exporter supports only single-staff works")
 
-        clef = next(iter(attributes.clef.values()))
-        key = next(iter(attributes.key.values()))
-        timesig = next(iter(attributes.timesig.values()))
+        clef = attributes.clef[0]
+        key = attributes.key[0]
+        timesig = attributes.timesig[0]
 
         if clef is not None:
             output.extend(clef.accept(self))
@@ -18,18 +18,27 @@
 Convert MTN AST into an APTED tree representation for Tree Edit Distance computations.
 """
 
+from typing import Any, List
+
 from .mtn import ast as AST
 
 
 class VisitorToAPTED(AST.Visitor):
-    """Convert tree into string representation for evaluation."""
+    """Convert tree into string representation for evaluation.
+
+    Every node of the APTED tree is built by _node, so subclasses can produce other
+    representations of the same tree by overriding it and _NO_NODE.
+    """
+
+    # Returned in place of a node for subtrees that have no APTED representation
+    _NO_NODE: Any = ""
 
     def __init__(self) -> None:
         super().__init__()
 
     def visit_toplevel(self, toplevel: AST.TopLevel) -> str:
         """Perform visiting operation on TopLevel node."""
-        return ""
+        return self._NO_NODE
 
     def visit_score(self, score: AST.Score) -> str:
         """Perform visiting operation on Score node."""
@@ -56,176 +65,176 @@ class VisitorToAPTED(AST.Visitor):
 
     def visit_note(self, note: AST.Note) -> str:
         """Perform visiting operation on Note node."""
-        output = "note"
-        output += note.notehead.accept(self)
-        output += "".join([x.accept(self) for x in note.dots])
-        output += "".join([x.accept(self) for x in note.accidentals])
-        output += "".join([x.accept(self) for x in note.modifiers])
-
-        return self._parenthesise(output)
-
-    def visit_token(self, token: AST.Token) -> str:
-        """Perform visiting operation on Token node."""
-        output = token.token_type.value
-        key_names = sorted(token.modifiers.keys())
-        mods = token.modifiers
-        modifiers = "_".join(
+        return self._node(
+            "note",
             [
-                (
-                    k
-                    if isinstance(mods[k], bool)
-                    else (
-                        str(mods[k].value)
-                        if hasattr(mods[k], "value")
-                        else str(mods[k])
-                    )
-                )
-                for k in key_names
-            ]
+                note.notehead.accept(self),
+                *[x.accept(self) for x in note.dots],
+                *[x.accept(self) for x in note.accidentals],
+                *[x.accept(self) for x in note.modifiers],
+            ],
         )
 
-        return self._parenthesise(output + ("_" * (len(modifiers) > 0)) + modifiers)
+    def visit_token(self, token: AST.Token) -> str:
+        """Perform visiting operation on Token node."""
+        return self._node(self._token_label(token), [])
 
     def visit_chord(self, chord: AST.Chord) -> str:
         """Perform visiting operation on Chord node."""
-        output = "chord"
-
         children = []
         if chord.stem is not None:
             children.append(chord.stem.accept(self))
         for child in chord.notes:
             children.append(child.accept(self))
 
-        return self._parenthesise(output + "".join(children))
+        return self._node("chord", children)
 
     def visit_rest(self, rest: AST.Rest) -> str:
         """Perform visiting operation on Rest node."""
-        output = "rest" + rest.rest_token.accept(self)
-        output += "".join([x.accept(self) for x in rest.dots])
-        output += "".join([x.accept(self) for x in rest.modifiers])
-
-        return self._parenthesise(output)
+        return self._node(
+            "rest",
+            [
+                rest.rest_token.accept(self),
+                *[x.accept(self) for x in rest.dots],
+                *[x.accept(self) for x in rest.modifiers],
+            ],
+        )
 
     def visit_note_group(self, note_group: AST.NoteGroup) -> str:
         """Perform visiting operation on NoteGroup node."""
-        output = "group"
-        output += "".join([x.accept(self) for x in note_group.appendages])
-        output += "".join([x.accept(self) for x in note_group.children])
-
-        return self._parenthesise(output)
+        return self._node(
+            "group",
+            [
+                *[x.accept(self) for x in note_group.appendages],
+                *[x.accept(self) for x in note_group.children],
+            ],
+        )
 
     def visit_attributes(self, attributes: AST.Attributes) -> str:
         """Perform visiting operation on Attributes node."""
-        output = "attributes"
-        for ii in sorted(attributes.key.keys()):
-            key = attributes.key[ii]
+        children = []
+        for key in attributes.key:
             if key is not None:
-                output += key.accept(self)
-        for ii in sorted(attributes.clef.keys()):
-            clef = attributes.clef[ii]
+                children.append(key.accept(self))
+        for clef in attributes.clef:
             if clef is not None:
-                output += clef.accept(self)
-        for ii in sorted(attributes.timesig.keys()):
-            timesig = attributes.timesig[ii]
+                children.append(clef.accept(self))
+        for timesig in attributes.timesig:
             if timesig is not None:
-                output += timesig.accept(self)
-        return self._parenthesise(output)
+                children.append(timesig.accept(self))
+        return self._node("attributes", children)
 
     def visit_time_signature(self, time_signature: AST.TimeSignature) -> str:
         """Perform visiting operation on TimeSignature node."""
-        output = "time_signature"
+        children = []
         if time_signature.time_symbol is not None:
-            output += time_signature.time_symbol.accept(self)
+            children.append(time_signature.time_symbol.accept(self))
 
         if time_signature.compound_time_signature is not None:
             for child in time_signature.compound_time_signature:
-                output += child.accept(self)
+                children.append(child.accept(self))
 
-        return self._parenthesise(output)
+        return self._node("time_signature", children)
 
     def visit_key(self, key: AST.Key) -> str:
         """Perform visiting operation on Key node."""
-        output = "key"
-        output += "".join([x.accept(self) for x in key.accidentals])
-        output += "".join([x.accept(self) for x in key.naturals])
-
-        return self._parenthesise(output)
+        return self._node(
+            "key",
+            [
+                *[x.accept(self) for x in key.accidentals],
+                *[x.accept(self) for x in key.naturals],
+            ],
+        )
 
     def visit_clef(self, clef: AST.Clef) -> str:
         """Perform visiting operation on Clef node."""
-        output = "clef"
         if clef.clef_token is not None:
-            output += clef.clef_token.accept(self)
-            return self._parenthesise(output)
+            return self._node("clef", [clef.clef_token.accept(self)])
         else:
-            return ""
+            return self._NO_NODE
 
     def visit_direction(self, direction: AST.Direction) -> str:
         """Perform visiting operation on Direction node."""
-        output = "direction"
-
-        for child in direction.directives:
-            output += child.accept(self)
-        return self._parenthesise(output)
+        return self._node("direction", [x.accept(self) for x in direction.directives])
 
     def visit_measure(self, measure: AST.Measure) -> str:
         """Perform visiting operation on Measure node."""
-        output = "measure"
+        children = []
         if measure.left_barline is not None:
-            output += measure.left_barline.accept(self)
+            children.append(measure.left_barline.accept(self))
         for child in measure.elements:
-            output += child.accept(self)
+            children.append(child.accept(self))
         if measure.right_barline is not None:
-            output += measure.right_barline.accept(self)
+            children.append(measure.right_barline.accept(self))
 
-        return self._parenthesise(output)
+        return self._node("measure", children)
 
     def visit_barline(self, barline: AST.Barline) -> str:
         """Perform visiting operation on Barline node."""
-        output = "barline"
-        output += "".join([x.accept(self) for x in barline.barline_tokens])
-        output += "".join([x.accept(self) for x in barline.modifiers])
-
-        return self._parenthesise(output)
+        return self._node(
+            "barline",
+            [
+                *[x.accept(self) for x in barline.barline_tokens],
+                *[x.accept(self) for x in barline.modifiers],
+            ],
+        )
 
     def visit_tuplet(self, tuplet: AST.Tuplet) -> str:
         """Perform visiting operation on Tuplet node."""
-        output = "tuplet"
-        output += tuplet.tuplet.accept(self)
+        children = [tuplet.tuplet.accept(self)]
         if tuplet.number is not None:
-            output += tuplet.number.accept(self)
+            children.append(tuplet.number.accept(self))
 
-        return self._parenthesise(output)
+        return self._node("tuplet", children)
 
     def visit_numerator(self, numerator: AST.Numerator) -> str:
         """Perform visiting operation on Numerator node."""
-        output = "numerator"
-        output += "".join([x.accept(self) for x in numerator.digits_or_sum])
-
-        return self._parenthesise(output)
+        return self._node(
+            "numerator", [x.accept(self) for x in numerator.digits_or_sum]
+        )
 
     def visit_denominator(self, denominator: AST.Denominator) -> str:
         """Perform visiting operation on Denominator node."""
-        output = "numerator"
-        output += denominator.digits.accept(self)
-
-        return self._parenthesise(output)
+        return self._node("numerator", [denominator.digits.accept(self)])
 
     def visit_number(self, number: AST.Number) -> str:
         """Perform visiting operation on Number node."""
-        output = "number"
-        output += "".join([x.accept(self) for x in number.digits])
-
-        return self._parenthesise(output)
+        return self._node("number", [x.accept(self) for x in number.digits])
 
     def visit_timesig_fraction(self, fraction: AST.TimesigFraction) -> str:
         """Perform visiting operation on timesig fraction node."""
-        output = "fraction"
-        output += fraction.numerator.accept(self)
+        children = [fraction.numerator.accept(self)]
         if fraction.denominator is not None:
-            output += fraction.denominator.accept(self)
+            children.append(fraction.denominator.accept(self))
+
+        return self._node("fraction", children)
+
+    def _node(self, label: str, children: List[Any]) -> Any:
+        """Build an APTED node from its label and its already converted children."""
+        return self._parenthesise(label + "".join(children))
+
+    @staticmethod
+    def _token_label(token: AST.Token) -> str:
+        """Get the label of the APTED node for a token."""
+        output = token.token_type.value
+        key_names = sorted(token.modifiers.keys())
+        mods = token.modifiers
+        modifiers = "_".join(
+            [
+                (
+                    k
+                    if isinstance(mods[k], bool)
+                    else (
+                        str(mods[k].value)
+                        if hasattr(mods[k], "value")
+                        else str(mods[k])
+                    )
+                )
+                for k in key_names
+            ]
+        )
 
-        return self._parenthesise(output)
+        return output + ("_" * (len(modifiers) > 0)) + modifiers
 
     def _parenthesise(self, sub: str) -> str:
         return "{" + sub + "}"
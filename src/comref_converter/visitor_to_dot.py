@@ -29,6 +29,7 @@ class VisitorToDOT(AST.Visitor):
     """Implements conversion to a model-readable sequence."""
 
     def __init__(self) -> None:
+        super().__init__()
         self.graph = pydot.Dot("MTN_score", graph_type="digraph")
         self.current_id = 0
 
@@ -176,15 +177,15 @@ class VisitorToDOT(AST.Visitor):
             subnode = self._create_node(f"STAFF {x}")
             self._create_edge(attributes_node, subnode)
 
-            curr_key = attributes.key[x]
+            curr_key = attributes.get_key(x)
             if curr_key is not None:
                 self._edge_token(curr_key, subnode)
 
-            curr_clef = attributes.clef[x]
+            curr_clef = attributes.get_clef(x)
             if curr_clef is not None:
                 self._edge_token(curr_clef, subnode)
 
-            curr_timesig = attributes.timesig[x]
+            curr_timesig = attributes.get_timesig(x)
             if curr_timesig is not None:
                 self._edge_token(curr_timesig, subnode)
 
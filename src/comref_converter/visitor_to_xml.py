@@ -19,7 +19,7 @@ Implementation of a visitor that converts the MTN objects into an XML representa
 """
 
 import xml.etree.ElementTree as ET
-from typing import List, Mapping, Sequence
+from typing import List, Sequence
 
 from .mtn import ast as AST
 from .mtn import types as TT
@@ -134,11 +134,10 @@ class VisitorToXML(AST.Visitor):
 
         return element
 
-    def _process_attr_dict(
-        self, root: ET.Element, attr_dict: Mapping[int, AST.SyntaxNode | None]
+    def _process_attr_list(
+        self, root: ET.Element, attr_list: Sequence[AST.SyntaxNode | None]
     ) -> None:
-        for ii in sorted(attr_dict.keys()):
-            elm = attr_dict[ii]
+        for ii, elm in enumerate(attr_list, start=1):
             if elm is not None:
                 result = elm.accept(self)
                 if result is not None:
@@ -148,9 +147,9 @@ class VisitorToXML(AST.Visitor):
     def visit_attributes(self, attributes: AST.Attributes) -> ET.Element:
         """Perform visiting operation on Attributes node."""
         element = ET.Element("attributes", attrib={"delta": str(attributes.delta)})
-        self._process_attr_dict(element, attributes.clef)
-        self._process_attr_dict(element, attributes.key)
-        self._process_attr_dict(element, attributes.timesig)
+        self._process_attr_list(element, attributes.clef)
+        self._process_attr_list(element, attributes.key)
+        self._process_attr_list(element, attributes.timesig)
         return element
 
     def visit_time_signature(
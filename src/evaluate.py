@@ -99,12 +99,27 @@ def main(args: Namespace) -> None:
     ter_dict = {}
     measure_stats_dict = {}
 
-    for measure in tqdm(shared):
-        (
-            confmat_dict[measure],
-            ter_dict[measure],
-            measure_stats_dict[measure],
-        ) = evaluator.update(prediction_loader[measure], target_loader[measure])
+    if args.workers > 1:
+        results = evaluator.update_batch(
+            [
+                (prediction_loader[measure], target_loader[measure])
+                for measure in shared
+            ],
+            max_workers=args.workers,
+        )
+        for measure, result in zip(shared, results):
+            (
+                confmat_dict[measure],
+                ter_dict[measure],
+                measure_stats_dict[measure],
+            ) = result
+    else:
+        for measure in tqdm(shared):
+            (
+                confmat_dict[measure],
+                ter_dict[measure],
+                measure_stats_dict[measure],
+            ) = evaluator.update(prediction_loader[measure], target_loader[measure])
 
     confmat, precrec, summary = evaluator.summarise()
 
@@ -198,6 +213,12 @@ def setup() -> Namespace:
         help="Folder where output files will be stored. Default: <Working Dir> / Eval",
         default=Path(__file__).parent,
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of processes used to evaluate measures. Default: 1",
+        default=1,
+    )
 
     args = parser.parse_args()
 
@@ -9,5 +9,5 @@ setup(
     author=__author__,
     author_email="ptorras@cvc.uab.cat",
     packages=["comref_converter"],
-    install_requires=["tqdm", "apted", "sortedcontainers", "pydot"],
+    install_requires=["tqdm", "apted", "pydot"],
 )
@@ -156,3 +156,27 @@ class TestScenarios(unittest.TestCase):
         self._run_end_to_end_test(
             self.MIDMEASURE_CHANGE_FNAME, self.MIDMEASURE_CHANGE_GTRUTH
         )
+
+    def test_streaming_translation(self) -> None:
+        """Translating while parsing yields the same score as translating a tree."""
+        for source in [
+            self.COMPLEX_FNAME,
+            self.MOVING_VOICES_FNAME,
+            self.BREAKING_BEAMS_FNAME,
+            self.TIMESIG_CHANGES_FNAME,
+            self.CLEF_CHANGES_FNAME,
+            self.MIDMEASURE_CHANGE_FNAME,
+        ]:
+            with self.subTest(source=source.stem), ZipFile(source) as f_zip:
+                xml_name = f_zip.namelist()[-1]
+                with f_zip.open(xml_name, "r") as xml_file:
+                    root = ET.parse(xml_file).getroot()
+                expected = comref.TranslatorMXML().translate(root, source.stem, set())
+
+                with f_zip.open(xml_name, "r") as xml_file:
+                    streamed = comref.TranslatorMXML().translate_file(
+                        xml_file, source.stem, set()
+                    )
+
+                self.assertEqual(len(streamed.measures), len(expected.measures))
+                self.assertTrue(streamed.compare(expected))